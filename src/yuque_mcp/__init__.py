@@ -32,6 +32,7 @@ from .models import (
     Visibility,
     YuqueAPIError,
     YuqueConfig,
+    get_config,
 )
 from .server import mcp
 
@@ -46,6 +47,7 @@ __all__ = [
     "YuqueClient",
     # Configuration
     "YuqueConfig",
+    "get_config",
     "YuqueAPIError",
     # Enums
     "ContentFormat",
@@ -6,13 +6,26 @@ with proper resource management and comprehensive error handling.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from functools import partial
 from types import TracebackType
-from typing import Any
+from typing import Any, TypeVar
+from urllib.parse import urlencode
 
 import httpx
+import orjson
+from pydantic import TypeAdapter
 
 from .models import (
+    DOC_LIST_ADAPTER,
+    REPO_LIST_ADAPTER,
+    SEARCH_LIST_ADAPTER,
+    TOC_LIST_ADAPTER,
     Document,
     DocumentCreate,
     DocumentUpdate,
@@ -23,9 +36,15 @@ from .models import (
     TocNode,
     User,
     YuqueAPIError,
+    YuqueBaseModel,
     YuqueConfig,
 )
 
+_ModelT = TypeVar("_ModelT", bound=YuqueBaseModel)
+
+# Produces the creation data of one document, e.g. by reading a file
+DocumentLoader = Callable[[], Awaitable[DocumentCreate]]
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
@@ -40,6 +59,94 @@ ERROR_MESSAGES: dict[int, str] = {
     500: "内部错误 (Internal server error)",
 }
 
+USER_AGENT = "yuque-mcp/0.2.0"
+
+# Connection pool sizing: MCP tools fan out several requests to the same host,
+# so keep enough warm connections around to avoid repeated TLS handshakes.
+HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+# Large documents may take a while to download, but an unreachable host
+# should fail fast rather than hold a tool call for the full timeout.
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# The token owner does not change during a client's lifetime
+USER_CACHE_TTL = 600.0
+
+# Repeated lookups of a missing document fail locally for a short while
+NOT_FOUND_CACHE_TTL = 30.0
+
+# Responses worth retrying. 429 means nothing was processed. A 5xx from a
+# gateway may follow a write the API already applied: retrying would append
+# TOC nodes twice or turn a finished DELETE into a 404, so only reads retry it.
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRY_5XX_METHODS = frozenset({"GET"})
+MAX_RETRY_DELAY = 60.0
+
+# Page size and page fetch concurrency when listing every repository
+REPO_PAGE_SIZE = 100
+MAX_CONCURRENT_PAGES = 10
+
+# Concurrent background reads when prefetching listed documents
+MAX_CONCURRENT_PREFETCH = 3
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying, honouring the Retry-After header.
+
+    Args:
+        response: The response that triggered the retry.
+        attempt: Zero-based number of the attempt that failed.
+
+    Returns:
+        Delay in seconds.
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), MAX_RETRY_DELAY)
+        except ValueError:
+            pass
+    # Exponential backoff with jitter
+    return min(0.25 * 2.0**attempt, 8.0) * (0.5 + random.random())
+
+
+def _cache_key(path: str, params: dict[str, Any] | None) -> str:
+    """Build a cache key from a request path and its query parameters."""
+    if not params:
+        return path
+    return f"{path}?{urlencode(sorted(params.items()))}"
+
+
+def _payload(data: YuqueBaseModel) -> dict[str, Any]:
+    """Build a request body from the fields of a write model that carry a value.
+
+    Equivalent to ``model_dump(exclude_none=True)`` for the flat request
+    models, without a pass through the pydantic serializer.
+    """
+    return {
+        name: value
+        for name in type(data).model_fields
+        if (value := getattr(data, name)) is not None
+    }
+
+
+def _rejected(error: YuqueAPIError) -> bool:
+    """Whether the API refused a request, so it certainly was not applied.
+
+    A 5xx, including the 500 raised for transport errors, may follow a write
+    the API already applied.
+    """
+    return 400 <= error.status_code < 500
+
+
+def _repo_base(repo_id: int | str) -> str:
+    """Return the API path of a repository, e.g. ``/api/v2/repos/user/repo``."""
+    return f"/api/v2/repos/{repo_id}"
+
 
 class YuqueClient:
     """Async HTTP client for Yuque API with proper lifecycle management.
@@ -75,7 +182,30 @@ class YuqueClient:
         """
         self.config = config
         self.base_url = config.base_url
+        self._headers = {
+            "X-Auth-Token": config.api_token,
+            "Content-Type": "application/json",
+            "User-Agent": USER_AGENT,
+        }
         self._client: httpx.AsyncClient | None = None
+        # key -> (stored_at, response, ETag); expired entries with an ETag are
+        # kept so the next request can revalidate them with If-None-Match
+        self._cache: OrderedDict[
+            str, tuple[float, dict[str, Any], str | None]
+        ] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[dict[str, Any]]] = {}
+        # Every GET task still running, including ones a write detached from
+        # _inflight, so close() can stop them all
+        self._requests: set[asyncio.Task[dict[str, Any]]] = set()
+        # Callers currently awaiting each in-flight GET task
+        self._waiters: dict[asyncio.Task[dict[str, Any]], int] = {}
+        # key -> (stored_at, error message) for GETs that returned 404
+        self._not_found: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        # Bumped by every write; responses to requests sent before the latest
+        # write may predate it, so they are returned but never cached
+        self._generation = 0
+        self._user_cache: tuple[float, User] | None = None
+        self._background: set[asyncio.Task[None]] = set()
         logger.debug("YuqueClient initialized with base_url=%s", self.base_url)
 
     @property
@@ -84,12 +214,10 @@ class YuqueClient:
         if self._client is None or self._client.is_closed:
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
-                headers={
-                    "X-Auth-Token": self.config.api_token,
-                    "Content-Type": "application/json",
-                    "User-Agent": "yuque-mcp/0.2.0",
-                },
-                timeout=30.0,
+                headers=self._headers,
+                timeout=HTTP_TIMEOUT,
+                limits=HTTP_LIMITS,
+                http2=True,
             )
             logger.debug("Created new httpx.AsyncClient")
         return self._client
@@ -98,12 +226,24 @@ class YuqueClient:
         """Close the HTTP client and release resources.
 
         This method should be called when the client is no longer needed
-        to properly release network resources.
+        to properly release network resources. Background prefetches and
+        GETs still in flight are cancelled and awaited first, so none of them
+        reopens the HTTP client or refills the caches afterwards.
         """
+        tasks = [*self._background, *self._requests]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._background.clear()
+        self._requests.clear()
+        self._inflight.clear()
         if self._client is not None and not self._client.is_closed:
             await self._client.aclose()
             logger.debug("Closed httpx.AsyncClient")
         self._client = None
+        self._cache.clear()
+        self._not_found.clear()
+        self._user_cache = None
 
     async def __aenter__(self) -> YuqueClient:
         """Enter async context manager."""
@@ -123,6 +263,9 @@ class YuqueClient:
     def _handle_error(self, response: httpx.Response) -> None:
         """Handle HTTP error responses.
 
+        The response body is only parsed for statuses without a canonical
+        message in ERROR_MESSAGES, or when debug logging wants the details.
+
         Args:
             response: The HTTP response to check for errors.
 
@@ -131,23 +274,137 @@ class YuqueClient:
         """
         status_code = response.status_code
 
+        mapped = ERROR_MESSAGES.get(status_code)
+        if mapped is not None and not logger.isEnabledFor(logging.DEBUG):
+            logger.error("API error: status=%d, message=%s", status_code, mapped)
+            raise YuqueAPIError(status_code, mapped)
+
         try:
-            error_data = response.json()
-            message = error_data.get("message", response.text)
+            error_data = orjson.loads(response.content)
+            message = error_data.get("message") or response.text
             details = error_data
         except Exception:
             message = response.text
             details = {}
 
         error_msg = ERROR_MESSAGES.get(status_code, message)
-        logger.error(
-            "API error: status=%d, message=%s, details=%s",
-            status_code,
-            error_msg,
-            details,
-        )
+        logger.error("API error: status=%d, message=%s", status_code, error_msg)
+        # The response body can be large; only render it when debugging
+        logger.debug("API error details: %s", details)
         raise YuqueAPIError(status_code, error_msg, details)
 
+    def _cache_get(self, key: str) -> dict[str, Any] | None:
+        """Return a cached GET response if caching allows it.
+
+        Args:
+            key: Cache key built from the request path and parameters.
+
+        Returns:
+            The cached response, or None on a miss or an expired entry.
+            Expired entries carrying an ETag stay cached for revalidation.
+        """
+        policy = self.config.cache_policy
+        if policy == "disabled":
+            return None
+
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        stored_at, result, etag = entry
+        if policy == "enabled" and time.monotonic() - stored_at >= self.config.cache_ttl:
+            if etag is None:
+                del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return result
+
+    def _cache_put(
+        self, key: str, result: dict[str, Any], etag: str | None = None
+    ) -> None:
+        """Store a GET response, evicting the least recently used beyond the limit.
+
+        Args:
+            key: Cache key built from the request path and parameters.
+            result: Parsed response to cache.
+            etag: ETag the API returned with the response, if any.
+        """
+        self._cache[key] = (time.monotonic(), result, etag)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.config.cache_max_entries:
+            self._cache.popitem(last=False)
+
+    def _remember_not_found(self, key: str, message: str) -> None:
+        """Remember a GET that returned 404 for ``NOT_FOUND_CACHE_TTL`` seconds.
+
+        Args:
+            key: Cache key built from the request path and parameters.
+            message: Error message to raise for repeated lookups.
+        """
+        self._not_found[key] = (time.monotonic(), message)
+        self._not_found.move_to_end(key)
+        if len(self._not_found) > self.config.cache_max_entries:
+            self._not_found.popitem(last=False)
+
+    def _invalidate(self, path: str) -> None:
+        """Drop every cached response after a write.
+
+        A repository is reachable both by ID and by namespace, and writes also
+        change user repository lists and search results, so no path prefix
+        identifies everything a write affects. Writes are rare next to reads,
+        so the whole cache is dropped.
+
+        Args:
+            path: API endpoint path that was modified.
+        """
+        stale = len(self._cache) + len(self._not_found)
+        self._generation += 1
+        # Later GETs must not join a request sent before the write
+        self._inflight.clear()
+        self._cache.clear()
+        # A write may create what an earlier GET could not find
+        self._not_found.clear()
+        # Repository writes change the user's books_count
+        self._user_cache = None
+        if stale:
+            logger.debug("Invalidated %d cached responses for %s", stale, path)
+
+    def _parse_item(self, model: type[_ModelT], data: dict[str, Any] | None) -> _ModelT:
+        """Build a model for the item of a single-entity response.
+
+        Args:
+            model: Model class of the item.
+            data: Item payload from the API response (None is treated as an
+                empty payload).
+
+        Returns:
+            Model instance.
+        """
+        return model.from_api(data or {}, trusted=self.config.trust_api)
+
+    def _parse_list(
+        self,
+        model: type[_ModelT],
+        adapter: TypeAdapter[list[_ModelT]],
+        items: list[dict[str, Any]] | None,
+    ) -> list[_ModelT]:
+        """Build models for the items of a list response.
+
+        Args:
+            model: Model class of the list items.
+            adapter: Pre-built list adapter for the model.
+            items: Item payloads from the API response (None is treated as
+                an empty list).
+
+        Returns:
+            List of model instances.
+        """
+        if not items:
+            return []
+        if self.config.trust_api:
+            return list(map(partial(model.from_api, trusted=True), items))
+        return adapter.validate_python(items)
+
     async def _request(
         self,
         method: str,
@@ -163,6 +420,89 @@ class YuqueClient:
             params: Query parameters.
             json: JSON request body.
 
+        Returns:
+            Parsed JSON response. GET responses may be served from the cache,
+            and concurrent identical GETs are coalesced into one request.
+
+        Raises:
+            YuqueAPIError: If the request fails or returns an error.
+        """
+        if method != "GET":
+            return await self._send(method, path, params, json)
+
+        cache_key = _cache_key(path, params)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug("Cache hit: %s", cache_key)
+            return cached
+
+        missing = self._not_found.get(cache_key)
+        if missing is not None:
+            stored_at, message = missing
+            if time.monotonic() - stored_at < NOT_FOUND_CACHE_TTL:
+                logger.debug("Cached 404: %s", cache_key)
+                raise YuqueAPIError(404, message)
+            del self._not_found[cache_key]
+
+        # Identical GETs already in flight share a single HTTP request
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._send(method, path, params, json, cache_key)
+            )
+            self._inflight[cache_key] = task
+            self._requests.add(task)
+            task.add_done_callback(lambda done: self._forget_inflight(cache_key, done))
+        else:
+            logger.debug("Joining in-flight request: %s", cache_key)
+
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            remaining = self._waiters.pop(task) - 1
+            if remaining:
+                self._waiters[task] = remaining
+            elif not task.done():
+                # The last caller was cancelled; nobody needs the response
+                task.cancel()
+
+    def _forget_inflight(
+        self, cache_key: str, task: asyncio.Task[dict[str, Any]]
+    ) -> None:
+        """Remove a finished request from the in-flight map.
+
+        The task's exception is read here, so a failure whose callers were
+        all cancelled is not logged as never retrieved.
+        """
+        self._requests.discard(task)
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+        if not task.cancelled():
+            task.exception()
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        cache_key: str | None = None,
+    ) -> dict[str, Any]:
+        """Send a request over HTTP and parse the response.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE).
+            path: API endpoint path.
+            params: Query parameters.
+            json: JSON request body.
+            cache_key: Cache key under which to store a GET response.
+
+        Rate-limited and transient server errors are retried with backoff
+        up to ``config.max_retries`` times before the error is raised. A GET
+        whose expired cache entry has an ETag is sent with If-None-Match, and
+        a 304 Not Modified answer renews and returns the cached response.
+
         Returns:
             Parsed JSON response.
 
@@ -171,23 +511,82 @@ class YuqueClient:
         """
         logger.debug("Request: %s %s params=%s", method, path, params)
 
+        # Encode the body once with orjson; retries resend the same bytes
+        content = orjson.dumps(json) if json is not None else None
+
+        generation = self._generation
+        stale = self._cache.get(cache_key) if cache_key is not None else None
+        headers = {"If-None-Match": stale[2]} if stale and stale[2] else None
+
         try:
-            response = await self._http_client.request(
-                method=method,
-                url=path,
-                params=params,
-                json=json,
+            attempt = 0
+            while True:
+                response = await self._http_client.request(
+                    method=method,
+                    url=path,
+                    params=params,
+                    content=content,
+                    headers=headers,
+                )
+                status_code = response.status_code
+                if (
+                    attempt >= self.config.max_retries
+                    or status_code not in RETRY_STATUS_CODES
+                    or (status_code != 429 and method not in RETRY_5XX_METHODS)
+                ):
+                    break
+
+                delay = _retry_delay(response, attempt)
+                attempt += 1
+                logger.warning(
+                    "Retrying %s %s after status %d in %.2fs (attempt %d/%d)",
+                    method,
+                    path,
+                    status_code,
+                    delay,
+                    attempt,
+                    self.config.max_retries,
+                )
+                await asyncio.sleep(delay)
+
+            store_key = (
+                cache_key
+                if self.config.cache_policy != "disabled"
+                and generation == self._generation
+                else None
             )
 
             if response.status_code >= 400:
-                self._handle_error(response)
-
-            result: dict[str, Any] = response.json()
+                try:
+                    self._handle_error(response)
+                except YuqueAPIError as e:
+                    if store_key is not None and e.status_code == 404:
+                        self._remember_not_found(store_key, e.message)
+                    raise
+
+            if response.status_code == 304 and stale:
+                logger.debug("Not modified: %s", cache_key)
+                if store_key is not None:
+                    self._cache_put(store_key, stale[1], stale[2])
+                return stale[1]
+
+            # Nothing to parse for 204 No Content or an empty body
+            if response.status_code == 204 or not response.content:
+                result: dict[str, Any] = {}
+            else:
+                result = orjson.loads(response.content)
+            if store_key is not None:
+                self._cache_put(store_key, result, response.headers.get("ETag"))
             return result
 
         except httpx.HTTPError as e:
-            logger.exception("HTTP request failed: %s", str(e))
+            logger.exception("HTTP request failed: %s", e)
             raise YuqueAPIError(500, f"HTTP request failed: {str(e)}") from e
+        finally:
+            # A write that failed in transit (e.g. a read timeout) may still
+            # have been applied, so the cache is dropped whatever the outcome
+            if cache_key is None:
+                self._invalidate(path)
 
     # =========================================================================
     # User Operations
@@ -196,14 +595,27 @@ class YuqueClient:
     async def get_current_user(self) -> User:
         """Get the current authenticated user.
 
+        Unless caching is disabled, the user is remembered for
+        ``USER_CACHE_TTL`` seconds, as the owner of the token cannot change
+        while the client is open.
+
         Returns:
             User object with profile information.
 
         Raises:
             YuqueAPIError: If the request fails.
         """
+        if (
+            self._user_cache is not None
+            and time.monotonic() - self._user_cache[0] < USER_CACHE_TTL
+        ):
+            return self._user_cache[1]
+        generation = self._generation
         result = await self._request("GET", "/api/v2/user")
-        return User(**result.get("data", {}))
+        user = self._parse_item(User, result.get("data"))
+        if self.config.cache_policy != "disabled" and generation == self._generation:
+            self._user_cache = (time.monotonic(), user)
+        return user
 
     # =========================================================================
     # Repository Operations
@@ -238,10 +650,60 @@ class YuqueClient:
             "GET", f"/api/v2/users/{login}/repos", params=params
         )
 
-        repos = [Repository(**repo) for repo in result.get("data", [])]
+        repos = self._parse_list(Repository, REPO_LIST_ADAPTER, result.get("data"))
         meta = result.get("meta", {})
         return repos, meta
 
+    async def list_all_repositories(
+        self,
+        login: str,
+        repo_type: str | None = None,
+        total: int | None = None,
+    ) -> list[Repository]:
+        """List every repository of a user or group.
+
+        The repository list response has no total count. When one is known
+        (e.g. ``User.books_count``), the remaining pages are fetched
+        concurrently after the first; pages past the estimate are then read
+        one by one until a short page is returned.
+
+        Args:
+            login: User or group login name.
+            repo_type: Filter by repository type ('Book' or 'Design').
+            total: Expected number of repositories, if known.
+
+        Returns:
+            List of all Repository objects.
+
+        Raises:
+            YuqueAPIError: If the request fails.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+
+        async def fetch_page(offset: int) -> list[Repository]:
+            async with semaphore:
+                page, _ = await self.list_repositories(
+                    login, repo_type, offset, REPO_PAGE_SIZE
+                )
+                return page
+
+        repos = await fetch_page(0)
+        offset = REPO_PAGE_SIZE
+        more = len(repos) == REPO_PAGE_SIZE
+        if more and total is not None and total > offset:
+            offsets = range(offset, total, REPO_PAGE_SIZE)
+            pages = await asyncio.gather(*(fetch_page(o) for o in offsets))
+            for page in pages:
+                repos.extend(page)
+            offset = offsets[-1] + REPO_PAGE_SIZE
+            more = len(pages[-1]) == REPO_PAGE_SIZE
+        while more:
+            page = await fetch_page(offset)
+            repos.extend(page)
+            offset += REPO_PAGE_SIZE
+            more = len(page) == REPO_PAGE_SIZE
+        return repos
+
     async def get_repository(self, repo_id: int | str) -> Repository:
         """Get repository details.
 
@@ -254,8 +716,8 @@ class YuqueClient:
         Raises:
             YuqueAPIError: If the request fails or repository not found.
         """
-        result = await self._request("GET", f"/api/v2/repos/{repo_id}")
-        return Repository(**result.get("data", {}))
+        result = await self._request("GET", _repo_base(repo_id))
+        return self._parse_item(Repository, result.get("data"))
 
     async def create_repository(
         self,
@@ -277,9 +739,9 @@ class YuqueClient:
         result = await self._request(
             "POST",
             f"/api/v2/users/{login}/repos",
-            json=data.model_dump(exclude_none=True),
+            json=_payload(data),
         )
-        return Repository(**result.get("data", {}))
+        return self._parse_item(Repository, result.get("data"))
 
     async def update_repository(
         self,
@@ -300,10 +762,10 @@ class YuqueClient:
         """
         result = await self._request(
             "PUT",
-            f"/api/v2/repos/{repo_id}",
-            json=data.model_dump(exclude_none=True),
+            _repo_base(repo_id),
+            json=_payload(data),
         )
-        return Repository(**result.get("data", {}))
+        return self._parse_item(Repository, result.get("data"))
 
     async def delete_repository(self, repo_id: int | str) -> Repository:
         """Delete a repository.
@@ -317,8 +779,8 @@ class YuqueClient:
         Raises:
             YuqueAPIError: If the request fails.
         """
-        result = await self._request("DELETE", f"/api/v2/repos/{repo_id}")
-        return Repository(**result.get("data", {}))
+        result = await self._request("DELETE", _repo_base(repo_id))
+        return self._parse_item(Repository, result.get("data"))
 
     # =========================================================================
     # Document Operations
@@ -345,14 +807,37 @@ class YuqueClient:
         """
         result = await self._request(
             "GET",
-            f"/api/v2/repos/{repo_id}/docs",
+            f"{_repo_base(repo_id)}/docs",
             params={"offset": offset, "limit": limit},
         )
 
-        docs = [Document(**doc) for doc in result.get("data", [])]
+        docs = self._parse_list(Document, DOC_LIST_ADAPTER, result.get("data"))
         meta = result.get("meta", {})
+        if self.config.prefetch_docs and self.config.cache_policy != "disabled":
+            doc_ids = [doc.id for doc in docs[: self.config.prefetch_docs]]
+            task = asyncio.ensure_future(self._prefetch_documents(repo_id, doc_ids))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
         return docs, meta
 
+    async def _prefetch_documents(self, repo_id: int | str, doc_ids: list[int]) -> None:
+        """Read documents in the background so later reads hit the cache.
+
+        Args:
+            repo_id: Repository ID or namespace.
+            doc_ids: IDs of the documents to read.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PREFETCH)
+
+        async def prefetch(doc_id: int) -> None:
+            async with semaphore:
+                try:
+                    await self._request("GET", f"{_repo_base(repo_id)}/docs/{doc_id}")
+                except YuqueAPIError as e:
+                    logger.debug("Prefetch of document %s failed: %s", doc_id, e.message)
+
+        await asyncio.gather(*(prefetch(doc_id) for doc_id in doc_ids))
+
     async def get_document(
         self,
         repo_id: int | str,
@@ -371,9 +856,9 @@ class YuqueClient:
             YuqueAPIError: If the request fails or document not found.
         """
         result = await self._request(
-            "GET", f"/api/v2/repos/{repo_id}/docs/{doc_id}"
+            "GET", f"{_repo_base(repo_id)}/docs/{doc_id}"
         )
-        return Document(**result.get("data", {}))
+        return self._parse_item(Document, result.get("data"))
 
     async def create_document(
         self,
@@ -397,10 +882,10 @@ class YuqueClient:
         """
         result = await self._request(
             "POST",
-            f"/api/v2/repos/{repo_id}/docs",
-            json=data.model_dump(exclude_none=True),
+            f"{_repo_base(repo_id)}/docs",
+            json=_payload(data),
         )
-        return Document(**result.get("data", {}))
+        return self._parse_item(Document, result.get("data"))
 
     async def update_document(
         self,
@@ -423,10 +908,10 @@ class YuqueClient:
         """
         result = await self._request(
             "PUT",
-            f"/api/v2/repos/{repo_id}/docs/{doc_id}",
-            json=data.model_dump(exclude_none=True),
+            f"{_repo_base(repo_id)}/docs/{doc_id}",
+            json=_payload(data),
         )
-        return Document(**result.get("data", {}))
+        return self._parse_item(Document, result.get("data"))
 
     async def delete_document(
         self,
@@ -446,9 +931,9 @@ class YuqueClient:
             YuqueAPIError: If the request fails.
         """
         result = await self._request(
-            "DELETE", f"/api/v2/repos/{repo_id}/docs/{doc_id}"
+            "DELETE", f"{_repo_base(repo_id)}/docs/{doc_id}"
         )
-        return Document(**result.get("data", {}))
+        return self._parse_item(Document, result.get("data"))
 
     # =========================================================================
     # TOC Operations
@@ -466,8 +951,8 @@ class YuqueClient:
         Raises:
             YuqueAPIError: If the request fails.
         """
-        result = await self._request("GET", f"/api/v2/repos/{repo_id}/toc")
-        return [TocNode(**item) for item in result.get("data", [])]
+        result = await self._request("GET", f"{_repo_base(repo_id)}/toc")
+        return self._parse_list(TocNode, TOC_LIST_ADAPTER, result.get("data"))
 
     async def update_toc(
         self,
@@ -504,29 +989,22 @@ class YuqueClient:
         Raises:
             YuqueAPIError: If the request fails.
         """
-        data: dict[str, Any] = {
-            "action": action,
-            "action_mode": action_mode,
+        optional_fields: dict[str, Any] = {
+            "doc_ids": doc_ids,
+            "target_uuid": target_uuid,
+            "node_uuid": node_uuid,
+            "type": node_type,
+            "title": title,
+            "url": url,
+            "open_window": open_window,
+            "visible": visible,
         }
+        data: dict[str, Any] = {"action": action, "action_mode": action_mode}
+        data.update(
+            (key, value) for key, value in optional_fields.items() if value is not None
+        )
 
-        if doc_ids is not None:
-            data["doc_ids"] = doc_ids
-        if target_uuid is not None:
-            data["target_uuid"] = target_uuid
-        if node_uuid is not None:
-            data["node_uuid"] = node_uuid
-        if node_type is not None:
-            data["type"] = node_type
-        if title is not None:
-            data["title"] = title
-        if url is not None:
-            data["url"] = url
-        if open_window is not None:
-            data["open_window"] = open_window
-        if visible is not None:
-            data["visible"] = visible
-
-        return await self._request("PUT", f"/api/v2/repos/{repo_id}/toc", json=data)
+        return await self._request("PUT", f"{_repo_base(repo_id)}/toc", json=data)
 
     async def add_document_to_toc(
         self,
@@ -544,6 +1022,30 @@ class YuqueClient:
         Returns:
             API response data.
 
+        Raises:
+            YuqueAPIError: If the request fails.
+        """
+        return await self.add_documents_to_toc(repo_id, [doc_id], parent_uuid)
+
+    async def add_documents_to_toc(
+        self,
+        repo_id: int | str,
+        doc_ids: list[int],
+        parent_uuid: str | None = None,
+    ) -> dict[str, Any]:
+        """Add several documents to the TOC in a single request.
+
+        The TOC API accepts a list of document IDs, so bulk additions cost one
+        round-trip and keep the given order, instead of one PUT per document.
+
+        Args:
+            repo_id: Repository ID or namespace.
+            doc_ids: Document IDs to add, in TOC order.
+            parent_uuid: Parent node UUID (if None, adds to root).
+
+        Returns:
+            API response data.
+
         Raises:
             YuqueAPIError: If the request fails.
         """
@@ -551,7 +1053,7 @@ class YuqueClient:
             repo_id=repo_id,
             action="appendNode",
             action_mode="child",
-            doc_ids=[doc_id],
+            doc_ids=doc_ids,
             target_uuid=parent_uuid,
             node_type="DOC",
         )
@@ -586,6 +1088,176 @@ class YuqueClient:
         repos, meta = await self.list_repositories(user.login, repo_type, offset, limit)
         return user, repos, meta
 
+    async def get_all_my_repositories(
+        self,
+        repo_type: str | None = None,
+    ) -> tuple[User, list[Repository]]:
+        """Get current user info and every one of their repositories.
+
+        The user's ``books_count`` sizes the concurrent page fetches of
+        list_all_repositories.
+
+        Args:
+            repo_type: Filter by repository type ('Book' or 'Design').
+
+        Returns:
+            Tuple of (User object, list of all Repository objects).
+
+        Raises:
+            YuqueAPIError: If the request fails.
+        """
+        user = await self.get_current_user()
+        repos = await self.list_all_repositories(
+            user.login, repo_type, total=user.books_count
+        )
+        return user, repos
+
+    async def create_document_with_toc(
+        self,
+        repo_id: int | str,
+        data: DocumentCreate,
+        parent_uuid: str | None = None,
+    ) -> Document:
+        """Create a document and add it to the table of contents.
+
+        If the API rejects the TOC update (4xx), the new document is deleted
+        again so no orphan document outside the TOC is left behind. After a
+        5xx the update may have been applied, so the document is kept rather
+        than leaving a TOC node pointing at a deleted document.
+
+        Args:
+            repo_id: Repository ID or namespace.
+            data: Document creation data.
+            parent_uuid: Parent node UUID (None for root level).
+
+        Returns:
+            The created Document object.
+
+        Raises:
+            YuqueAPIError: If creating the document or updating the TOC fails.
+        """
+        doc = await self.create_document(repo_id, data)
+        try:
+            await self.add_document_to_toc(repo_id, doc.id, parent_uuid)
+        except YuqueAPIError as error:
+            if not _rejected(error):
+                logger.warning(
+                    "TOC update for document %s failed with status %d; "
+                    "keeping the document as the update may have been applied",
+                    doc.id,
+                    error.status_code,
+                )
+                raise
+            try:
+                await self.delete_document(repo_id, doc.id)
+            except YuqueAPIError as e:
+                logger.error(
+                    "Failed to delete document %s after TOC update error: %s",
+                    doc.id,
+                    e.message,
+                )
+            raise
+        return doc
+
+    async def create_documents_with_toc(
+        self,
+        repo_id: int | str,
+        items: Sequence[DocumentCreate | DocumentLoader],
+        parent_uuid: str | None = None,
+        max_concurrent: int = 5,
+    ) -> list[Document | Exception]:
+        """Create several documents concurrently and add them to the TOC.
+
+        At most ``max_concurrent`` items are in progress at a time. An item is
+        either creation data or a loader producing it, which runs inside that
+        limit so only the documents being created are held in memory. All
+        created documents are then added to the TOC with a single update. If
+        the API rejects that update (4xx), or a create fails with anything
+        other than a YuqueAPIError, the created documents are deleted again
+        before the error propagates. After a 5xx from the update they are
+        kept, as it may have been applied.
+
+        Args:
+            repo_id: Repository ID or namespace.
+            items: Document creation data or loaders, one per document.
+            parent_uuid: Parent node UUID (None for root level).
+            max_concurrent: Maximum items loaded and created at once.
+
+        Returns:
+            One entry per item, in order: the created Document, the exception
+            raised by its loader, or the YuqueAPIError that prevented its
+            creation.
+
+        Raises:
+            YuqueAPIError: If the TOC update fails.
+            Exception: Any non-API error raised while creating a document,
+                re-raised after the created documents are rolled back.
+        """
+        semaphore = asyncio.Semaphore(max(max_concurrent, 1))
+        results: list[Document | Exception | None] = [None] * len(items)
+
+        async def create(index: int, item: DocumentCreate | DocumentLoader) -> None:
+            async with semaphore:
+                if isinstance(item, DocumentCreate):
+                    data = item
+                else:
+                    try:
+                        data = await item()
+                    except Exception as e:
+                        # Nothing was created for this item
+                        results[index] = e
+                        return
+                try:
+                    results[index] = await self.create_document(repo_id, data)
+                except YuqueAPIError as e:
+                    results[index] = e
+
+        outcomes = await asyncio.gather(
+            *(create(index, item) for index, item in enumerate(items)),
+            return_exceptions=True,
+        )
+        docs = [doc for doc in results if isinstance(doc, Document)]
+        for outcome in outcomes:
+            if outcome is not None:
+                await self._delete_documents(repo_id, docs)
+                raise outcome
+        if docs:
+            try:
+                await self.add_documents_to_toc(
+                    repo_id, [doc.id for doc in docs], parent_uuid
+                )
+            except YuqueAPIError as error:
+                if _rejected(error):
+                    await self._delete_documents(repo_id, docs)
+                else:
+                    logger.warning(
+                        "TOC update for %d documents failed with status %d; "
+                        "keeping them as the update may have been applied",
+                        len(docs),
+                        error.status_code,
+                    )
+                raise
+        return [result for result in results if result is not None]
+
+    async def _delete_documents(
+        self, repo_id: int | str, docs: list[Document]
+    ) -> None:
+        """Roll back created documents, logging any that cannot be deleted.
+
+        Args:
+            repo_id: Repository ID or namespace.
+            docs: Documents to delete.
+        """
+        outcomes = await asyncio.gather(
+            *(self.delete_document(repo_id, doc.id) for doc in docs),
+            return_exceptions=True,
+        )
+        for doc, outcome in zip(docs, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.error(
+                    "Failed to delete document %s during rollback: %s", doc.id, outcome
+                )
+
     async def get_repository_overview(
         self,
         repo_id: int | str,
@@ -593,7 +1265,8 @@ class YuqueClient:
         """Get repository details and its table of contents in one call.
 
         This method combines get_repository and get_toc to provide a complete
-        overview of a knowledge base including its structure.
+        overview of a knowledge base including its structure. Both requests
+        are independent and are issued concurrently.
 
         Args:
             repo_id: Repository ID or namespace (e.g., 'user/repo').
@@ -604,8 +1277,10 @@ class YuqueClient:
         Raises:
             YuqueAPIError: If the request fails.
         """
-        repo = await self.get_repository(repo_id)
-        toc = await self.get_toc(repo_id)
+        repo, toc = await asyncio.gather(
+            self.get_repository(repo_id),
+            self.get_toc(repo_id),
+        )
         return repo, toc
 
     async def search_and_read(
@@ -613,6 +1288,7 @@ class YuqueClient:
         query: str,
         repo_id: int | str,
         read_first: bool = True,
+        prefetch: int = 1,
     ) -> tuple[list[SearchResult], Document | None, dict[str, Any]]:
         """Search for documents and optionally read the first result.
 
@@ -623,6 +1299,8 @@ class YuqueClient:
             query: Search keywords (max 200 characters).
             repo_id: Repository ID or namespace to search within.
             read_first: Whether to read the first matching document (default: True).
+            prefetch: Number of top results to read concurrently. The first of
+                them that can be read is returned (default: 1).
 
         Returns:
             Tuple of (list of SearchResult objects, first Document or None, metadata).
@@ -640,14 +1318,19 @@ class YuqueClient:
 
         first_doc = None
         if read_first and results:
-            # Extract doc_id from the first result
-            first_result = results[0]
-            if first_result.id:
-                try:
-                    first_doc = await self.get_document(repo_id, first_result.id)
-                except YuqueAPIError:
-                    # If we can't read the document, just return search results
-                    pass
+            candidates = [item.id for item in results[: max(prefetch, 1)] if item.id]
+            docs = await asyncio.gather(
+                *(self.get_document(repo_id, doc_id) for doc_id in candidates),
+                return_exceptions=True,
+            )
+            for doc in docs:
+                if isinstance(doc, YuqueAPIError):
+                    # If we can't read the document, fall back to the next one
+                    continue
+                if isinstance(doc, BaseException):
+                    raise doc
+                first_doc = doc
+                break
 
         return results, first_doc, meta
 
@@ -682,6 +1365,6 @@ class YuqueClient:
 
         result = await self._request("GET", "/api/v2/search", params=params)
 
-        results = [SearchResult(**item) for item in result.get("data", [])]
+        results = self._parse_list(SearchResult, SEARCH_LIST_ADAPTER, result.get("data"))
         meta = result.get("meta", {})
         return results, meta
@@ -6,13 +6,26 @@ ensuring proper validation and serialization of API responses.
 
 from __future__ import annotations
 
+import sys
 from datetime import datetime
 from enum import Enum
-from typing import Any
-
-from pydantic import BaseModel, Field, field_validator
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Annotated, Any, Literal
+
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    computed_field,
+)
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -26,6 +39,18 @@ class YuqueConfig(BaseSettings):
     Attributes:
         api_token: Yuque API token for authentication.
         base_url: Base URL for Yuque API (default: https://www.yuque.com).
+        cache_policy: GET response caching ("enabled" honours cache_ttl,
+            "replay" serves cached responses until invalidated by a write,
+            "disabled" always hits the API).
+        cache_ttl: Seconds a cached GET response stays fresh.
+        cache_max_entries: Cached GET responses kept before the least
+            recently used one is evicted.
+        trust_api: Build results with model_construct, skipping validation
+            of data returned by the Yuque API.
+        max_retries: Retries for rate-limited (429) responses, and for
+            transient 5xx responses to reads.
+        prefetch_docs: Documents of a listed page read in the background into
+            the response cache (0 disables prefetching).
 
     Example:
         Set environment variables:
@@ -46,6 +71,46 @@ class YuqueConfig(BaseSettings):
         default="https://www.yuque.com",
         description="Yuque API base URL",
     )
+    cache_policy: Literal["enabled", "disabled", "replay"] = Field(
+        default="enabled",
+        description="GET response caching policy",
+    )
+    cache_ttl: float = Field(
+        default=300.0,
+        description="Seconds a cached GET response stays fresh",
+    )
+    cache_max_entries: int = Field(
+        default=256,
+        ge=1,
+        description="Cached GET responses kept before evicting the least recently used",
+    )
+    trust_api: bool = Field(
+        default=False,
+        description="Skip validation when building results from API data",
+    )
+    max_retries: int = Field(
+        default=3,
+        ge=0,
+        description="Retries for rate-limited and transient server errors",
+    )
+    prefetch_docs: int = Field(
+        default=0,
+        ge=0,
+        description="Listed documents to read ahead into the response cache",
+    )
+
+
+@lru_cache(maxsize=1)
+def get_config() -> YuqueConfig:
+    """Get the process-wide Yuque configuration.
+
+    Environment variables and the .env file are read once, on first call.
+    Use ``get_config.cache_clear()`` to force a reload.
+
+    Returns:
+        The cached YuqueConfig instance.
+    """
+    return YuqueConfig()
 
 
 # =============================================================================
@@ -141,7 +206,77 @@ class RepoType(str, Enum):
 class YuqueBaseModel(BaseModel):
     """Base model with common configuration for all Yuque models."""
 
-    model_config = {"extra": "ignore", "populate_by_name": True}
+    # Core schemas are built on first use, so importing the package does not
+    # pay for models a session never touches
+    model_config = {"extra": "ignore", "populate_by_name": True, "defer_build": True}
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any], trusted: bool = False) -> Self:
+        """Build a model from an item of a Yuque API response.
+
+        Args:
+            data: Item payload as returned by the API.
+            trusted: Use model_construct and skip validation. Values keep their
+                raw JSON types (e.g. timestamps stay strings), so this is only
+                meant for data that is displayed rather than processed.
+
+        Returns:
+            The model instance.
+        """
+        if trusted:
+            return cls.model_construct(**data)  # type: ignore[return-value]
+        return cls.model_validate(data)
+
+
+def _empty_to_none(v: Any) -> Any:
+    """Treat the empty string the API sends for missing ids as None."""
+    return None if v == "" else v
+
+
+# Optional integer that may arrive as a numeric string or ""
+OptIntFromStr = Annotated[int | None, BeforeValidator(_empty_to_none)]
+
+# Visibility level as a plain int bounded to the Visibility values; unlike the
+# enum, pydantic-core checks it as an integer range and it stays an int
+VisibilityLevel = Annotated[int, Field(ge=0, le=2)]
+
+# Short enumerated values (types, formats) repeat across every item of a list
+# response; interning makes them share one str object. Kept as str rather than
+# Literal so values the API adds later still validate.
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+
+def _parse_timestamp(value: str | None) -> datetime | None:
+    """Parse an ISO 8601 timestamp from the API (accepts a trailing 'Z')."""
+    if not value:
+        return None
+    if value.endswith("Z"):
+        value = f"{value[:-1]}+00:00"
+    return datetime.fromisoformat(value)
+
+
+class TimestampedModel(YuqueBaseModel):
+    """Base model for entities carrying creation and update timestamps.
+
+    Timestamps are kept as the raw ISO 8601 strings from the API; the
+    ``*_dt`` properties parse them on first access, so list views that never
+    look at them do not pay for datetime parsing.
+    """
+
+    created_at: str | None = Field(None, description="Creation time (ISO 8601)")
+    updated_at: str | None = Field(None, description="Last update time (ISO 8601)")
+
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
+    def created_at_dt(self) -> datetime | None:
+        """Creation time as a datetime."""
+        return _parse_timestamp(self.created_at)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
+    def updated_at_dt(self) -> datetime | None:
+        """Last update time as a datetime."""
+        return _parse_timestamp(self.updated_at)
 
 
 # =============================================================================
@@ -149,7 +284,7 @@ class YuqueBaseModel(BaseModel):
 # =============================================================================
 
 
-class User(YuqueBaseModel):
+class User(TimestampedModel):
     """Yuque user model.
 
     Represents a user account on Yuque platform.
@@ -166,8 +301,6 @@ class User(YuqueBaseModel):
     )
     followers_count: int | None = Field(None, description="Followers count")
     following_count: int | None = Field(None, description="Following count")
-    created_at: datetime | None = Field(None, description="Account creation time")
-    updated_at: datetime | None = Field(None, description="Last update time")
 
 
 # =============================================================================
@@ -175,25 +308,23 @@ class User(YuqueBaseModel):
 # =============================================================================
 
 
-class Repository(YuqueBaseModel):
+class Repository(TimestampedModel):
     """Yuque repository (knowledge base) model.
 
     Represents a knowledge base that contains documents.
     """
 
     id: int = Field(..., description="Repository ID")
-    type: str = Field(..., description="Repository type (Book, Design)")
+    type: InternedStr = Field(..., description="Repository type (Book, Design)")
     slug: str = Field(..., description="Repository slug for URL")
     name: str = Field(..., description="Repository name")
     user_id: int = Field(..., description="Owner user ID")
     description: str | None = Field(None, description="Repository description")
-    public: int = Field(default=0, description="Visibility level (0=private)")
+    public: VisibilityLevel = Field(default=0, description="Visibility level (0=private)")
     items_count: int | None = Field(None, description="Document count")
     namespace: str | None = Field(
         None, description="Full namespace (user/repo)"
     )
-    created_at: datetime | None = Field(None, description="Creation time")
-    updated_at: datetime | None = Field(None, description="Last update time")
 
 
 class RepositoryCreate(YuqueBaseModel):
@@ -202,7 +333,7 @@ class RepositoryCreate(YuqueBaseModel):
     name: str = Field(..., description="Repository name")
     slug: str = Field(..., description="Repository slug for URL")
     description: str | None = Field(None, description="Repository description")
-    public: int = Field(default=0, description="Visibility level")
+    public: VisibilityLevel = Field(default=0, description="Visibility level")
     enhancedPrivacy: bool | None = Field(
         None, description="Enhanced privacy - excludes team members except admins"
     )
@@ -214,7 +345,7 @@ class RepositoryUpdate(YuqueBaseModel):
     name: str | None = Field(None, description="New repository name")
     slug: str | None = Field(None, description="New repository slug")
     description: str | None = Field(None, description="New description")
-    public: int | None = Field(None, description="New visibility level")
+    public: VisibilityLevel | None = Field(None, description="New visibility level")
 
 
 # =============================================================================
@@ -222,7 +353,7 @@ class RepositoryUpdate(YuqueBaseModel):
 # =============================================================================
 
 
-class Document(YuqueBaseModel):
+class Document(TimestampedModel):
     """Yuque document model.
 
     Represents a document within a repository.
@@ -233,18 +364,16 @@ class Document(YuqueBaseModel):
     title: str = Field(..., description="Document title")
     book_id: int = Field(..., description="Parent repository ID")
     user_id: int = Field(..., description="Author user ID")
-    format: str | None = Field(None, description="Content format")
+    format: InternedStr | None = Field(None, description="Content format")
     body: str | None = Field(None, description="Document content (raw)")
     body_draft: str | None = Field(None, description="Draft content")
     body_html: str | None = Field(None, description="HTML rendered content")
     body_lake: str | None = Field(None, description="Lake format content")
-    public: int = Field(default=0, description="Visibility level")
+    public: VisibilityLevel = Field(default=0, description="Visibility level")
     status: int | None = Field(None, description="Document status")
     word_count: int | None = Field(None, description="Word count")
     cover: str | None = Field(None, description="Cover image URL")
     description: str | None = Field(None, description="Document description")
-    created_at: datetime | None = Field(None, description="Creation time")
-    updated_at: datetime | None = Field(None, description="Last update time")
 
 
 class DocumentCreate(YuqueBaseModel):
@@ -254,7 +383,7 @@ class DocumentCreate(YuqueBaseModel):
     body: str = Field(..., description="Document content")
     format: str = Field(default="markdown", description="Content format")
     slug: str | None = Field(None, description="Custom slug for URL")
-    public: int = Field(default=0, description="Visibility level")
+    public: VisibilityLevel = Field(default=0, description="Visibility level")
 
 
 class DocumentUpdate(YuqueBaseModel):
@@ -263,7 +392,7 @@ class DocumentUpdate(YuqueBaseModel):
     title: str | None = Field(None, description="New title")
     body: str | None = Field(None, description="New content")
     format: str | None = Field(None, description="New format")
-    public: int | None = Field(None, description="New visibility level")
+    public: VisibilityLevel | None = Field(None, description="New visibility level")
 
 
 # =============================================================================
@@ -278,12 +407,12 @@ class TocNode(YuqueBaseModel):
     """
 
     uuid: str = Field(..., description="Node unique identifier")
-    type: str = Field(..., description="Node type (DOC, LINK, TITLE)")
+    type: InternedStr = Field(..., description="Node type (DOC, LINK, TITLE)")
     title: str = Field(..., description="Node title")
     url: str | None = Field(None, description="Link URL (for LINK type)")
     slug: str | None = Field(None, description="Node URL slug (deprecated)")
-    doc_id: int | None = Field(None, description="Document ID (for DOC type)")
-    id: int | None = Field(None, description="Document ID (deprecated, use doc_id)")
+    doc_id: OptIntFromStr = Field(None, description="Document ID (for DOC type)")
+    id: OptIntFromStr = Field(None, description="Document ID (deprecated, use doc_id)")
     level: int | None = Field(None, description="Nesting level (1-based)")
     depth: int | None = Field(None, description="Nesting level (deprecated, use level)")
     visible: int = Field(default=1, description="Visibility flag (0=hidden, 1=visible)")
@@ -293,32 +422,22 @@ class TocNode(YuqueBaseModel):
     sibling_uuid: str | None = Field(None, description="Next sibling node UUID")
     prev_uuid: str | None = Field(None, description="Previous sibling node UUID")
 
-    @field_validator("doc_id", mode="before")
-    @classmethod
-    def parse_doc_id(cls, v: Any) -> int | None:
-        """Handle empty string from API as None."""
-        if v == "" or v is None:
-            return None
-        return int(v)
-
-    @field_validator("id", mode="before")
-    @classmethod
-    def parse_id(cls, v: Any) -> int | None:
-        """Handle empty string from API as None."""
-        if v == "" or v is None:
-            return None
-        return int(v)
-
 
 class TocUpdateRequest(YuqueBaseModel):
     """Model for updating table of contents."""
 
-    action: TocAction = Field(..., description="Action to perform")
-    action_mode: TocActionMode = Field(..., description="Action mode")
+    action: Literal["appendNode", "prependNode", "editNode", "removeNode"] = Field(
+        ..., description="Action to perform (see TocAction)"
+    )
+    action_mode: Literal["sibling", "child"] = Field(
+        ..., description="Action mode (see TocActionMode)"
+    )
     doc_ids: list[int] | None = Field(None, description="Document IDs to add")
     target_uuid: str | None = Field(None, description="Target node UUID")
     node_uuid: str | None = Field(None, description="Node UUID to operate on")
-    type: TocNodeType | None = Field(None, description="Node type")
+    type: Literal["DOC", "LINK", "TITLE"] | None = Field(
+        None, description="Node type (see TocNodeType)"
+    )
     title: str | None = Field(None, description="Node title")
     url: str | None = Field(None, description="Link URL")
     open_window: int | None = Field(None, description="Open in new window (0=same, 1=new)")
@@ -337,7 +456,7 @@ class SearchResult(YuqueBaseModel):
     """
 
     id: int = Field(..., description="Result item ID")
-    type: str = Field(..., description="Result type (doc or repo)")
+    type: InternedStr = Field(..., description="Result type (doc or repo)")
     title: str = Field(..., description="Result title")
     summary: str | None = Field(None, description="Result summary/snippet")
     url: str = Field(..., description="Result URL")
@@ -361,3 +480,16 @@ class PaginatedResponse(YuqueBaseModel):
 
     data: list[Any] = Field(default_factory=list, description="Response data list")
     meta: dict[str, Any] | None = Field(None, description="Pagination metadata")
+
+
+# =============================================================================
+# List Adapters
+# =============================================================================
+
+# Created once so each list response is validated in a single pydantic-core
+# call; like the models, their schemas are built on first use.
+_DEFERRED = ConfigDict(defer_build=True)
+REPO_LIST_ADAPTER = TypeAdapter(list[Repository], config=_DEFERRED)
+DOC_LIST_ADAPTER = TypeAdapter(list[Document], config=_DEFERRED)
+TOC_LIST_ADAPTER = TypeAdapter(list[TocNode], config=_DEFERRED)
+SEARCH_LIST_ADAPTER = TypeAdapter(list[SearchResult], config=_DEFERRED)
@@ -4,14 +4,20 @@ This module provides an MCP server that exposes Yuque API functionality
 as tools for AI assistants. It includes proper lifecycle management,
 comprehensive error handling, and well-designed tool interfaces.
 
-Tool Count: 13 tools (11 original + 2 file-based upload tools)
+Tool Count: 15 tools (11 original + 4 file-based upload tools)
 - Combined operations reduce API calls
 - Removed dangerous/low-frequency operations
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import re
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import cache, lru_cache, partial
 from pathlib import Path
 from typing import Any
 
@@ -23,8 +29,36 @@ from .models import (
     DocumentCreate,
     DocumentUpdate,
     RepositoryCreate,
+    TocAction,
+    TocActionMode,
+    Visibility,
     YuqueAPIError,
-    YuqueConfig,
+    get_config,
+)
+
+# Upper bound on documents added by one TOC update
+MAX_TOC_DOC_IDS = 500
+
+# Inputs the Yuque API would reject, checked before any request is made
+MAX_QUERY_LENGTH = 200
+TOC_ACTIONS = frozenset(action.value for action in TocAction)
+TOC_ACTION_MODES = frozenset(mode.value for mode in TocActionMode)
+VISIBILITY_LEVELS = frozenset(level.value for level in Visibility)
+
+# Upper bound on search results read concurrently by yuque_search_and_read
+MAX_SEARCH_PREFETCH = 5
+
+# Upper bound on files read and created at once by the bulk import tools
+MAX_IMPORT_CONCURRENCY = 10
+
+# A '# heading' as the first non-blank line, searched in the file's head only.
+# Lines end where str.splitlines() ends them, and surrounding whitespace
+# (including the full-width space common in Chinese text) is stripped.
+TITLE_SCAN_CHARS = 4096
+_LINE_BREAKS = "\r\n\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+TITLE_PATTERN = re.compile(
+    rf"\A\s*# [^\S{_LINE_BREAKS}]*(\S[^{_LINE_BREAKS}]*?)"
+    rf"[^\S{_LINE_BREAKS}]*(?:[{_LINE_BREAKS}]|\Z)"
 )
 
 # Configure logging
@@ -34,10 +68,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Global client instance (lazy initialization)
-_client: YuqueClient | None = None
-
 
+@cache
 def get_client() -> YuqueClient:
     """Get the global Yuque client instance (lazy initialization).
 
@@ -47,20 +79,33 @@ def get_client() -> YuqueClient:
     Raises:
         RuntimeError: If initialization fails.
     """
-    global _client
-    if _client is None:
-        try:
-            config = YuqueConfig()
-            _client = YuqueClient(config)
-            logger.info("Yuque client initialized successfully")
-        except Exception as e:
-            logger.error("Failed to initialize Yuque client: %s", e)
-            raise RuntimeError(f"Failed to initialize YuqueClient: {e}") from e
-    return _client
+    try:
+        client = YuqueClient(get_config())
+    except Exception as e:
+        logger.error("Failed to initialize Yuque client: %s", e)
+        raise RuntimeError(f"Failed to initialize YuqueClient: {e}") from e
+    logger.info("Yuque client initialized successfully")
+    return client
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared Yuque client and its connection pool on shutdown.
+
+    Args:
+        server: The FastMCP server being run.
+    """
+    try:
+        yield
+    finally:
+        # Only close a client that was actually created
+        if get_client.cache_info().currsize:
+            await get_client().close()
+            logger.info("Yuque client closed")
 
 
 # Initialize FastMCP server
-mcp = FastMCP("Yuque MCP Server")
+mcp = FastMCP("Yuque MCP Server", lifespan=_lifespan)
 
 
 # =============================================================================
@@ -95,34 +140,69 @@ def format_repository(repo: Any) -> str:
     )
 
 
-def format_document(doc: Any) -> str:
-    """Format document information for display."""
-    content = doc.body or doc.body_html or "(No content)"
-    return (
+def _document_parts(doc: Any) -> tuple[str, str]:
+    """Split a formatted document into its header and its content.
+
+    Callers that embed a document in a longer output join the parts once,
+    rather than copying the (possibly large) content twice.
+    """
+    header = (
         f"# {doc.title}\n\n"
         f"**ID**: {doc.id}\n"
         f"**Slug**: {doc.slug}\n"
         f"**Format**: {doc.format}\n"
         f"**Word Count**: {doc.word_count or 0}\n"
         f"**Visibility**: {'Public' if doc.public == 1 else 'Private'}\n\n"
-        f"---\n\n{content}"
+        f"---\n\n"
     )
+    return header, doc.body or doc.body_html or "(No content)"
 
 
-def format_toc(toc_items: list[Any]) -> str:
-    """Format table of contents for display."""
+def format_document(doc: Any) -> str:
+    """Format document information for display."""
+    return "".join(_document_parts(doc))
+
+
+TOC_TYPE_ICONS = {"DOC": "📄", "LINK": "🔗", "TITLE": "📁"}
+# Indent strings for the common nesting depths; deeper nodes build their own
+TOC_INDENTS = tuple("  " * depth for depth in range(8))
+
+
+def _toc_parts(toc_items: list[Any]) -> list[str]:
+    """Format table of contents as pieces to be joined once by the caller."""
     if not toc_items:
-        return "Table of contents is empty."
+        return ["Table of contents is empty."]
 
-    output = "📑 Table of Contents\n\n"
+    parts = ["📑 Table of Contents\n\n"]
     for item in toc_items:
-        indent = "  " * ((item.level or 1) - 1)
-        type_icon = {"DOC": "📄", "LINK": "🔗", "TITLE": "📁"}.get(item.type, "•")
-        output += f"{indent}{type_icon} {item.title}\n"
-        doc_id_str = item.doc_id if item.doc_id else ""
-        output += f"{indent}   UUID: {item.uuid} | Doc ID: {doc_id_str}\n"
+        depth = (item.level or 1) - 1
+        indent = TOC_INDENTS[depth] if depth < len(TOC_INDENTS) else "  " * depth
+        type_icon = TOC_TYPE_ICONS.get(item.type, "•")
+        parts.append(
+            f"{indent}{type_icon} {item.title}\n"
+            f"{indent}   UUID: {item.uuid} | Doc ID: {item.doc_id or ''}\n"
+        )
+    return parts
+
+
+def format_toc(toc_items: list[Any]) -> str:
+    """Format table of contents for display."""
+    return "".join(_toc_parts(toc_items))
+
+
+# =============================================================================
+# Input Validation
+# =============================================================================
+
 
-    return output
+def _visibility_error(public: int | None) -> str | None:
+    """Return an error message for an unknown visibility level, else None.
+
+    None means the caller left visibility unchanged and is always accepted.
+    """
+    if public is None or public in VISIBILITY_LEVELS:
+        return None
+    return f"✗ Error: Unknown visibility level {public} (0=private, 1=public, 2=internal)."
 
 
 # =============================================================================
@@ -167,26 +247,31 @@ async def yuque_get_my_repositories(
     repo_type: str | None = None,
     offset: int = 0,
     limit: int = 20,
+    fetch_all: bool = False,
 ) -> str:
-    """List user's repos with user info. repo_type: Book|Design, limit: max 100."""
+    """List user's repos with user info. repo_type: Book|Design, limit: max 100, fetch_all: every page."""
     try:
         client = get_client()
-        user, repos, meta = await client.get_my_repositories(repo_type, offset, limit)
+        if fetch_all:
+            user, repos = await client.get_all_my_repositories(repo_type)
+        else:
+            user, repos, _ = await client.get_my_repositories(repo_type, offset, limit)
 
-        output = format_user(user)
-        output += "\n---\n\n"
+        parts = [format_user(user), "\n---\n\n"]
 
         if not repos:
-            output += "No repositories found."
-            return output
+            parts.append("No repositories found.")
+            return "".join(parts)
 
-        output += f"📚 My Repositories ({len(repos)} shown)\n\n"
+        parts.append(f"📚 My Repositories ({len(repos)} shown)\n\n")
         for i, repo in enumerate(repos, 1):
-            output += f"{i}. **{repo.name}**\n"
-            output += f"   ID: {repo.id} | Namespace: {repo.namespace}\n"
-            output += f"   Documents: {repo.items_count or 0} | Type: {repo.type}\n\n"
+            parts.append(
+                f"{i}. **{repo.name}**\n"
+                f"   ID: {repo.id} | Namespace: {repo.namespace}\n"
+                f"   Documents: {repo.items_count or 0} | Type: {repo.type}\n\n"
+            )
 
-        return output
+        return "".join(parts)
     except YuqueAPIError as e:
         return f"✗ Error: {e.message}"
 
@@ -206,11 +291,9 @@ async def yuque_get_repository_overview(repo_id: str) -> str:
         client = get_client()
         repo, toc_items = await client.get_repository_overview(repo_id)
 
-        output = format_repository(repo)
-        output += "\n---\n\n"
-        output += format_toc(toc_items)
-
-        return output
+        return "".join(
+            [format_repository(repo), "\n---\n\n", *_toc_parts(toc_items)]
+        )
     except YuqueAPIError as e:
         return f"✗ Error: {e.message}"
 
@@ -232,6 +315,8 @@ async def yuque_create_repository(
     public: int = 0,
 ) -> str:
     """Create repo under user/group (login). slug: URL path (alphanumeric/-). public: 0=private,1=public,2=internal."""
+    if error := _visibility_error(public):
+        return error
     try:
         client = get_client()
         data = RepositoryCreate(
@@ -257,35 +342,129 @@ async def yuque_create_repository(
 # =============================================================================
 
 
+@lru_cache(maxsize=1024)
+def _resolve_path(file_path: str) -> Path:
+    """Resolve a user-supplied path, remembering results for repeated imports.
+
+    Relative paths resolve against the server's working directory, which
+    does not change while it runs.
+    """
+    return Path(file_path).expanduser().resolve()
+
+
 def _read_markdown_file(file_path: str) -> tuple[str, str | None]:
     """Read a markdown file and extract title from first heading if present.
 
     Returns:
         Tuple of (content, extracted_title). extracted_title may be None.
     """
-    path = Path(file_path).expanduser().resolve()
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {path}")
-    if not path.is_file():
-        raise ValueError(f"Not a file: {path}")
-
-    content = path.read_text(encoding="utf-8")
+    path = _resolve_path(file_path)
+    try:
+        content = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {path}") from None
+    except IsADirectoryError:
+        raise ValueError(f"Not a file: {path}") from None
 
     # Try to extract title from first '# heading'
-    title = None
-    for line in content.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("# ") and not stripped.startswith("##"):
-            title = stripped[2:].strip()
-            break
-        elif stripped:  # Non-empty, non-heading line found first
-            break
+    match = TITLE_PATTERN.match(content, 0, TITLE_SCAN_CHARS)
+    return content, match.group(1) if match else None
+
+
+def _document_from_file(
+    file_path: str,
+    title: str | None = None,
+    slug: str | None = None,
+    public: int = 0,
+) -> DocumentCreate:
+    """Build creation data for a markdown file.
+
+    The title is the explicit one if given, else the file's first '# heading',
+    else the file name.
+    """
+    content, extracted_title = _read_markdown_file(file_path)
+    return DocumentCreate(
+        title=title if title is not None else extracted_title or Path(file_path).stem,
+        body=content,
+        format="markdown",
+        slug=slug,
+        public=public,
+    )
 
-    return content, title
+
+def _list_markdown_files(dir_path: str) -> list[str]:
+    """List the .md files directly inside a directory, sorted by name.
+
+    Raises:
+        FileNotFoundError: If the directory does not exist.
+        ValueError: If the path is not a directory.
+    """
+    path = _resolve_path(dir_path)
+    try:
+        with os.scandir(path) as entries:
+            return sorted(
+                entry.path
+                for entry in entries
+                if entry.name.lower().endswith(".md") and entry.is_file()
+            )
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Directory not found: {path}") from None
+    except NotADirectoryError:
+        raise ValueError(f"Not a directory: {path}") from None
+
+
+async def _create_documents_from_files(
+    repo_id: str,
+    file_paths: list[str],
+    parent_uuid: str | None,
+    max_concurrent: int,
+) -> str:
+    """Create documents from markdown files and report the outcome per file.
+
+    Each file is read in a worker thread right before its document is
+    created, so at most ``max_concurrent`` files (clamped to 1 to
+    ``MAX_IMPORT_CONCURRENCY``) are held in memory and reads overlap other
+    files' creates. All documents are added to the TOC together by the client.
+    """
+    if len(file_paths) > MAX_TOC_DOC_IDS:
+        return (
+            f"✗ Error: {len(file_paths)} files given; at most "
+            f"{MAX_TOC_DOC_IDS} can be imported at once."
+        )
+
+    try:
+        client = get_client()
+        created = await client.create_documents_with_toc(
+            repo_id,
+            [
+                partial(asyncio.to_thread, _document_from_file, path)
+                for path in file_paths
+            ],
+            parent_uuid,
+            min(max(max_concurrent, 1), MAX_IMPORT_CONCURRENCY),
+        )
+    except YuqueAPIError as e:
+        return f"✗ Error: {e.message}"
+
+    lines: list[str] = []
+    succeeded = 0
+    for file_path, outcome in zip(file_paths, created, strict=True):
+        if isinstance(outcome, YuqueAPIError):
+            lines.append(f"✗ {file_path}: Error: {outcome.message}")
+        elif isinstance(outcome, Exception):
+            lines.append(f"✗ {file_path}: File error: {outcome}")
+        else:
+            succeeded += 1
+            lines.append(f"✓ {file_path}: ID {outcome.id} | Title: {outcome.title}")
+
+    return (
+        f"Created {succeeded} of {len(file_paths)} documents and added them to TOC\n\n"
+        + "\n".join(lines)
+    )
 
 
 # =============================================================================
-# Document Tools (7 tools) - Includes file-based upload tools
+# Document Tools (9 tools) - Includes file-based upload tools
 # =============================================================================
 
 
@@ -307,19 +486,21 @@ async def yuque_list_documents(
     try:
         client = get_client()
         docs, meta = await client.list_documents(repo_id, offset, limit)
-        total = meta.get("total", len(docs))
+        total = meta.get("total") or len(docs)
 
         if not docs:
             return "No documents found in this repository."
 
-        output = f"📚 Documents in repository (Total: {total})\n\n"
+        parts = [f"📚 Documents in repository (Total: {total})\n\n"]
         for i, doc in enumerate(docs, 1):
-            output += f"{i}. **{doc.title}**\n"
-            output += f"   ID: {doc.id} | Slug: {doc.slug}\n"
-            updated = doc.updated_at.isoformat() if doc.updated_at else "N/A"
-            output += f"   Words: {doc.word_count or 0} | Updated: {updated}\n\n"
-
-        return output
+            updated = doc.updated_at or "N/A"
+            parts.append(
+                f"{i}. **{doc.title}**\n"
+                f"   ID: {doc.id} | Slug: {doc.slug}\n"
+                f"   Words: {doc.word_count or 0} | Updated: {updated}\n\n"
+            )
+
+        return "".join(parts)
     except YuqueAPIError as e:
         return f"✗ Error: {e.message}"
 
@@ -362,10 +543,12 @@ async def yuque_create_document_with_toc(
     parent_uuid: str | None = None,
 ) -> str:
     """Create doc and auto-add to TOC. format: markdown|html|lake. parent_uuid: folder UUID or None for root."""
+    if error := _visibility_error(public):
+        return error
     try:
         client = get_client()
 
-        # Create the document
+        # Create the document and add it to the TOC
         data = DocumentCreate(
             title=title,
             body=body,
@@ -373,10 +556,7 @@ async def yuque_create_document_with_toc(
             slug=slug,
             public=public,
         )
-        doc = await client.create_document(repo_id, data)
-
-        # Add to TOC
-        await client.add_document_to_toc(repo_id, doc.id, parent_uuid)
+        doc = await client.create_document_with_toc(repo_id, data, parent_uuid)
 
         return (
             f"✓ Document created and added to TOC!\n\n"
@@ -407,6 +587,10 @@ async def yuque_update_document(
     public: int | None = None,
 ) -> str:
     """Update doc fields (only provided params are changed). format: markdown|html|lake."""
+    if title is None and body is None and format is None and public is None:
+        return "✗ Error: No fields provided to update."
+    if error := _visibility_error(public):
+        return error
     try:
         client = get_client()
         data = DocumentUpdate(
@@ -416,7 +600,7 @@ async def yuque_update_document(
             public=public,
         )
         doc = await client.update_document(repo_id, doc_id, data)
-        updated = doc.updated_at.isoformat() if doc.updated_at else "N/A"
+        updated = doc.updated_at or "N/A"
         return (
             f"✓ Document updated successfully!\n\n"
             f"ID: {doc.id}\n"
@@ -467,26 +651,15 @@ async def yuque_create_document_from_file(
     parent_uuid: str | None = None,
 ) -> str:
     """Create doc from a local .md file and auto-add to TOC. Reads file content from file_path to avoid passing large body text. Title auto-extracted from first '# heading' if not provided."""
+    if error := _visibility_error(public):
+        return error
     try:
-        content, extracted_title = _read_markdown_file(file_path)
-
-        # Determine title: explicit > extracted from heading > filename
-        if title is None:
-            if extracted_title:
-                title = extracted_title
-            else:
-                title = Path(file_path).stem
+        data = await asyncio.to_thread(
+            _document_from_file, file_path, title, slug, public
+        )
 
         client = get_client()
-        data = DocumentCreate(
-            title=title,
-            body=content,
-            format="markdown",
-            slug=slug,
-            public=public,
-        )
-        doc = await client.create_document(repo_id, data)
-        await client.add_document_to_toc(repo_id, doc.id, parent_uuid)
+        doc = await client.create_document_with_toc(repo_id, data, parent_uuid)
 
         return (
             f"✓ Document created from file and added to TOC!\n\n"
@@ -502,6 +675,55 @@ async def yuque_create_document_from_file(
         return f"✗ Error: {e.message}"
 
 
+@mcp.tool(
+    name="yuque_create_documents_from_files",
+    annotations=ToolAnnotations(
+        readOnlyHint=False,
+        destructiveHint=False,
+        idempotentHint=False,
+        openWorldHint=False,
+    ),
+)
+async def yuque_create_documents_from_files(
+    repo_id: str,
+    file_paths: list[str],
+    parent_uuid: str | None = None,
+    max_concurrent: int = 5,
+) -> str:
+    """Create docs from several local .md files concurrently and add them all to TOC. Titles come from each file's first '# heading' or its filename. max_concurrent: files imported at once (1-10)."""
+    return await _create_documents_from_files(
+        repo_id, file_paths, parent_uuid, max_concurrent
+    )
+
+
+@mcp.tool(
+    name="yuque_create_documents_from_directory",
+    annotations=ToolAnnotations(
+        readOnlyHint=False,
+        destructiveHint=False,
+        idempotentHint=False,
+        openWorldHint=False,
+    ),
+)
+async def yuque_create_documents_from_directory(
+    repo_id: str,
+    dir_path: str,
+    parent_uuid: str | None = None,
+    max_concurrent: int = 5,
+) -> str:
+    """Create docs from every .md file directly inside a local directory (sorted by name) and add them all to TOC. Titles come from each file's first '# heading' or its filename. max_concurrent: files imported at once (1-10)."""
+    try:
+        file_paths = await asyncio.to_thread(_list_markdown_files, dir_path)
+    except (FileNotFoundError, ValueError) as e:
+        return f"✗ File error: {e}"
+    if not file_paths:
+        return f"No markdown files found in {dir_path}"
+
+    return await _create_documents_from_files(
+        repo_id, file_paths, parent_uuid, max_concurrent
+    )
+
+
 @mcp.tool(
     name="yuque_update_document_from_file",
     annotations=ToolAnnotations(
@@ -519,8 +741,12 @@ async def yuque_update_document_from_file(
     public: int | None = None,
 ) -> str:
     """Update doc content from a local .md file. Reads file content from file_path to avoid passing large body text. Title auto-extracted from first '# heading' if not provided."""
+    if error := _visibility_error(public):
+        return error
     try:
-        content, extracted_title = _read_markdown_file(file_path)
+        content, extracted_title = await asyncio.to_thread(
+            _read_markdown_file, file_path
+        )
 
         # Use extracted title only if no explicit title given
         effective_title = title if title is not None else extracted_title
@@ -533,7 +759,7 @@ async def yuque_update_document_from_file(
             public=public,
         )
         doc = await client.update_document(repo_id, doc_id, data)
-        updated = doc.updated_at.isoformat() if doc.updated_at else "N/A"
+        updated = doc.updated_at or "N/A"
         return (
             f"✓ Document updated from file!\n\n"
             f"ID: {doc.id}\n"
@@ -575,13 +801,27 @@ async def yuque_update_toc(
     visible: int | None = None,
 ) -> str:
     """Modify TOC structure. To create a group/folder, use node_type='TITLE'. action: appendNode|prependNode|editNode|removeNode. action_mode: child|sibling."""
+    if action not in TOC_ACTIONS:
+        return f"✗ Error: Unknown action '{action}'."
+    if action_mode not in TOC_ACTION_MODES:
+        return f"✗ Error: Unknown action_mode '{action_mode}'."
+    if action == "editNode" and all(
+        value is None for value in (node_type, title, url, open_window, visible)
+    ):
+        return "✗ Error: No fields provided to edit."
     try:
         client = get_client()
 
-        # Parse doc_ids string to list
+        # Parse doc_ids string to list (int() already ignores surrounding spaces);
+        # oversized lists are rejected before any entry is parsed
         doc_id_list = None
         if doc_ids:
-            doc_id_list = [int(id.strip()) for id in doc_ids.split(",")]
+            if doc_ids.count(",") >= MAX_TOC_DOC_IDS:
+                return f"✗ Error: at most {MAX_TOC_DOC_IDS} doc_ids per TOC update"
+            try:
+                doc_id_list = list(map(int, doc_ids.split(",")))
+            except ValueError as e:
+                return f"✗ Error: doc_ids must be comma-separated integers ({e})"
 
         await client.update_toc(
             repo_id=repo_id,
@@ -624,35 +864,43 @@ async def yuque_search_and_read(
     query: str,
     repo_id: str,
     read_first: bool = True,
+    prefetch: int = 1,
 ) -> str:
-    """Search docs in repo and optionally fetch first result's full content. query: max 200 chars."""
+    """Search docs in repo and optionally fetch first result's full content. query: max 200 chars. prefetch: top results read concurrently (1-5); the first readable one is shown."""
+    if not query.strip():
+        return "✗ Error: Search query is empty."
+    if len(query) > MAX_QUERY_LENGTH:
+        return f"✗ Error: Search query exceeds {MAX_QUERY_LENGTH} characters."
+    if not 1 <= prefetch <= MAX_SEARCH_PREFETCH:
+        return f"✗ Error: prefetch must be between 1 and {MAX_SEARCH_PREFETCH}."
     try:
         client = get_client()
         results, first_doc, meta = await client.search_and_read(
             query=query,
             repo_id=repo_id,
             read_first=read_first,
+            prefetch=prefetch,
         )
-        total = meta.get("total", len(results))
+        total = meta.get("total") or len(results)
 
         if not results:
             return f"No documents found matching '{query}'."
 
-        output = f"🔍 Search results for '{query}' ({total} found)\n\n"
+        parts = [f"🔍 Search results for '{query}' ({total} found)\n\n"]
         for i, item in enumerate(results, 1):
-            marker = "→ " if i == 1 and read_first else ""
-            output += f"{marker}{i}. **{item.title}**\n"
-            output += f"   Type: {item.type} | URL: {item.url}\n"
-            if item.summary:
-                output += f"   Summary: {item.summary}\n"
-            output += "\n"
+            marker = "→ " if first_doc and item.id == first_doc.id else ""
+            summary = f"   Summary: {item.summary}\n" if item.summary else ""
+            parts.append(
+                f"{marker}{i}. **{item.title}**\n"
+                f"   Type: {item.type} | URL: {item.url}\n"
+                f"{summary}\n"
+            )
 
         if first_doc:
-            output += "\n---\n\n"
-            output += "📄 First Result Content:\n\n"
-            output += format_document(first_doc)
+            parts.append("\n---\n\n📄 First Result Content:\n\n")
+            parts.extend(_document_parts(first_doc))
 
-        return output
+        return "".join(parts)
     except YuqueAPIError as e:
         return f"✗ Error: {e.message}"
 
@@ -663,7 +911,18 @@ async def yuque_search_and_read(
 
 
 def main() -> None:
-    """Run the MCP server."""
+    """Run the MCP server.
+
+    Uses the uvloop event loop when it is installed (``pip install
+    yuque-mcp[uvloop]``), otherwise the default asyncio loop.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
     mcp.run()
 
 
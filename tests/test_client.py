@@ -1,17 +1,32 @@
 """Tests for the Yuque API client."""
 
+import asyncio
+from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
+from pydantic import ValidationError
 
-from yuque_mcp.client import YuqueClient
+from yuque_mcp.client import (
+    ERROR_MESSAGES,
+    HTTP_LIMITS,
+    HTTP_TIMEOUT,
+    USER_AGENT,
+    YuqueClient,
+)
 from yuque_mcp.models import (
     Document,
     DocumentCreate,
+    DocumentUpdate,
     Repository,
+    TocAction,
+    TocNode,
+    TocUpdateRequest,
     User,
     YuqueAPIError,
     YuqueConfig,
+    get_config,
 )
 
 
@@ -42,6 +57,29 @@ class TestYuqueClient:
         await client.close()
         assert client._client is None
 
+    @pytest.mark.asyncio
+    async def test_client_headers(self, mock_config: YuqueConfig) -> None:
+        """Test HTTP client sends auth and identification headers."""
+        async with YuqueClient(mock_config) as client:
+            headers = client._http_client.headers
+            assert headers["X-Auth-Token"] == "test_token_123"
+            assert headers["Content-Type"] == "application/json"
+            assert headers["User-Agent"] == USER_AGENT
+
+    @pytest.mark.asyncio
+    async def test_client_connection_pool(self, mock_config: YuqueConfig) -> None:
+        """Test HTTP client uses a tuned, HTTP/2-enabled connection pool."""
+        with patch(
+            "yuque_mcp.client.httpx.AsyncClient", wraps=httpx.AsyncClient
+        ) as async_client:
+            async with YuqueClient(mock_config) as client:
+                _ = client._http_client
+
+        kwargs = async_client.call_args.kwargs
+        assert kwargs["limits"] is HTTP_LIMITS
+        assert kwargs["timeout"] is HTTP_TIMEOUT
+        assert kwargs["http2"] is True
+
     @pytest.mark.asyncio
     async def test_get_current_user(
         self, mock_config: YuqueConfig, mock_user_response: dict
@@ -123,7 +161,11 @@ class TestYuqueClient:
 
             assert isinstance(doc, Document)
             assert doc.title == "Test Document"
-            mock_request.assert_called_once()
+            mock_request.assert_called_once_with(
+                "POST",
+                "/api/v2/repos/67890/docs",
+                json=doc_data.model_dump(exclude_none=True),
+            )
 
         await client.close()
 
@@ -149,6 +191,30 @@ class TestYuqueClient:
 
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_list_all_repositories(
+        self, mock_config: YuqueConfig, mock_repository_response: dict
+    ) -> None:
+        """Test all repository pages are fetched, reading past a stale total."""
+        client = YuqueClient(mock_config)
+        page_sizes = {0: 100, 100: 100, 200: 100, 300: 30}
+
+        async def fake_request(method, path, params=None, json=None):
+            count = page_sizes.get(params["offset"], 0)
+            return {"data": [mock_repository_response["data"]] * count}
+
+        with patch.object(client, "_request", side_effect=fake_request) as mock_request:
+            repos = await client.list_all_repositories("testuser", total=250)
+
+        offsets = [call.kwargs["params"]["offset"] for call in mock_request.call_args_list]
+        assert len(repos) == 330
+        assert offsets == [0, 100, 200, 300]
+        assert all(
+            call.kwargs["params"]["limit"] == 100 for call in mock_request.call_args_list
+        )
+
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_get_toc(
         self, mock_config: YuqueConfig, mock_toc_response: dict
@@ -169,6 +235,704 @@ class TestYuqueClient:
 
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_get_toc_trusted(
+        self, mock_config: YuqueConfig, mock_toc_response: dict
+    ) -> None:
+        """Test trusted TOC items are constructed without validation."""
+        config = mock_config.model_copy(update={"trust_api": True})
+        client = YuqueClient(config)
+
+        with patch.object(client, "_request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = mock_toc_response
+            toc = await client.get_toc("67890")
+            assert [item.uuid for item in toc] == ["uuid-1", "uuid-2"]
+
+            mock_request.return_value = {"data": None}
+            assert await client.get_toc("67890") == []
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_document_trusted(
+        self, mock_config: YuqueConfig, mock_document_response: dict
+    ) -> None:
+        """Test trusted single-entity responses are constructed without validation."""
+        config = mock_config.model_copy(update={"trust_api": True})
+        client = YuqueClient(config)
+
+        with patch.object(client, "_request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = mock_document_response
+            with patch.object(Document, "model_validate") as mock_validate:
+                doc = await client.get_document("67890", "11111")
+
+            mock_validate.assert_not_called()
+            assert doc.id == 11111
+            assert doc.title == mock_document_response["data"]["title"]
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_repository_overview(
+        self,
+        mock_config: YuqueConfig,
+        mock_repository_response: dict,
+        mock_toc_response: dict,
+    ) -> None:
+        """Test repository overview fetches details and TOC."""
+        client = YuqueClient(mock_config)
+        responses = {
+            "/api/v2/repos/67890": mock_repository_response,
+            "/api/v2/repos/67890/toc": mock_toc_response,
+        }
+
+        with patch.object(client, "_request", new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = lambda method, path, **kwargs: responses[path]
+
+            repo, toc = await client.get_repository_overview("67890")
+
+            assert repo.name == "Test Repository"
+            assert len(toc) == 2
+            assert mock_request.call_count == 2
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_search_and_read_prefetch(
+        self, mock_config: YuqueConfig, mock_document_response: dict
+    ) -> None:
+        """Test search_and_read falls back to the next prefetched result."""
+        client = YuqueClient(mock_config)
+        search_response = {
+            "data": [
+                {"id": 1, "type": "doc", "title": "Locked", "url": "/a"},
+                {"id": 11111, "type": "doc", "title": "Open", "url": "/b"},
+            ],
+            "meta": {"total": 2},
+        }
+
+        async def fake_request(method: str, path: str, **kwargs: object) -> dict:
+            if path == "/api/v2/search":
+                return search_response
+            if path.endswith("/docs/1"):
+                raise YuqueAPIError(403, "Permission denied")
+            return mock_document_response
+
+        with patch.object(client, "_request", side_effect=fake_request):
+            results, doc, meta = await client.search_and_read(
+                "test", "67890", prefetch=2
+            )
+
+            assert len(results) == 2
+            assert doc is not None
+            assert doc.id == 11111
+            assert meta["total"] == 2
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_error_response(self, mock_config: YuqueConfig, httpx_mock) -> None:
+        """Test API errors are parsed and raised as YuqueAPIError."""
+        httpx_mock.add_response(status_code=418, json={"message": "I'm a teapot"})
+
+        async with YuqueClient(mock_config) as client:
+            with pytest.raises(YuqueAPIError) as exc_info:
+                await client.get_repository("67890")
+
+        assert exc_info.value.status_code == 418
+        assert exc_info.value.message == "I'm a teapot"
+        assert exc_info.value.details == {"message": "I'm a teapot"}
+
+    @pytest.mark.asyncio
+    async def test_mapped_error_response(
+        self, mock_config: YuqueConfig, httpx_mock
+    ) -> None:
+        """Test known error statuses use the canonical message."""
+        httpx_mock.add_response(status_code=404, json={"message": "Not Found"})
+
+        async with YuqueClient(mock_config) as client:
+            with pytest.raises(YuqueAPIError) as exc_info:
+                await client.get_repository("67890")
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.message == ERROR_MESSAGES[404]
+
+    @pytest.mark.asyncio
+    async def test_retry_after_rate_limit(
+        self, mock_config: YuqueConfig, mock_user_response: dict, httpx_mock
+    ) -> None:
+        """Test 429 responses are retried honouring Retry-After."""
+        httpx_mock.add_response(status_code=429, headers={"Retry-After": "0"})
+        httpx_mock.add_response(json=mock_user_response)
+
+        async with YuqueClient(mock_config) as client:
+            user = await client.get_current_user()
+
+        assert user.login == "testuser"
+        assert len(httpx_mock.get_requests()) == 2
+
+    @pytest.mark.asyncio
+    async def test_no_retry_for_failed_post(
+        self, mock_config: YuqueConfig, httpx_mock
+    ) -> None:
+        """Test server errors on non-idempotent writes are not retried."""
+        httpx_mock.add_response(status_code=500)
+
+        async with YuqueClient(mock_config) as client:
+            with pytest.raises(YuqueAPIError) as exc_info:
+                await client.create_document(
+                    "67890", DocumentCreate(title="Test", body="Body")
+                )
+
+        assert exc_info.value.status_code == 500
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_no_retry_for_failed_toc_update(
+        self, mock_config: YuqueConfig, httpx_mock
+    ) -> None:
+        """Test gateway errors on TOC updates are not retried, as appends repeat."""
+        httpx_mock.add_response(status_code=502)
+
+        async with YuqueClient(mock_config) as client:
+            with pytest.raises(YuqueAPIError) as exc_info:
+                await client.add_documents_to_toc("67890", [11111])
+
+        assert exc_info.value.status_code == 502
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_add_document_to_toc(self, mock_config: YuqueConfig) -> None:
+        """Test TOC updates send only the provided fields."""
+        client = YuqueClient(mock_config)
+
+        with patch.object(client, "_request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = {"data": []}
+
+            await client.add_document_to_toc("67890", 11111)
+
+            mock_request.assert_called_once_with(
+                "PUT",
+                "/api/v2/repos/67890/toc",
+                json={
+                    "action": "appendNode",
+                    "action_mode": "child",
+                    "doc_ids": [11111],
+                    "type": "DOC",
+                },
+            )
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_add_documents_to_toc(self, mock_config: YuqueConfig) -> None:
+        """Test bulk TOC additions are sent as one request."""
+        client = YuqueClient(mock_config)
+
+        with patch.object(client, "_request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = {"data": []}
+
+            await client.add_documents_to_toc("67890", [1, 2, 3], "uuid-1")
+
+            mock_request.assert_called_once()
+            payload = mock_request.call_args.kwargs["json"]
+            assert payload["doc_ids"] == [1, 2, 3]
+            assert payload["target_uuid"] == "uuid-1"
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_request_body_encoded(
+        self, mock_config: YuqueConfig, mock_document_response: dict, httpx_mock
+    ) -> None:
+        """Test write payloads are sent as compact JSON without unset fields."""
+        httpx_mock.add_response(json=mock_document_response)
+
+        async with YuqueClient(mock_config) as client:
+            await client.update_document("67890", "11111", DocumentUpdate(title="标题"))
+
+        request = httpx_mock.get_requests()[0]
+        assert request.headers["Content-Type"] == "application/json"
+        assert request.content == '{"title":"标题"}'.encode()
+
+    @pytest.mark.asyncio
+    async def test_create_document_with_toc_rolls_back(
+        self, mock_config: YuqueConfig, mock_document_response: dict, httpx_mock
+    ) -> None:
+        """Test a failed TOC update deletes the document that was just created."""
+        httpx_mock.add_response(method="POST", json=mock_document_response)
+        httpx_mock.add_response(method="PUT", status_code=403)
+        httpx_mock.add_response(method="DELETE", json=mock_document_response)
+
+        async with YuqueClient(mock_config) as client:
+            with pytest.raises(YuqueAPIError) as exc_info:
+                await client.create_document_with_toc(
+                    "67890", DocumentCreate(title="Test", body="Body")
+                )
+
+        assert exc_info.value.status_code == 403
+        requests = httpx_mock.get_requests()
+        assert [request.method for request in requests] == ["POST", "PUT", "DELETE"]
+        assert requests[2].url.path == "/api/v2/repos/67890/docs/11111"
+
+    @pytest.mark.asyncio
+    async def test_create_document_with_toc_keeps_doc_after_server_error(
+        self, mock_config: YuqueConfig, mock_document_response: dict, httpx_mock
+    ) -> None:
+        """Test a 5xx TOC update, which may have been applied, deletes nothing."""
+        httpx_mock.add_response(method="POST", json=mock_document_response)
+        httpx_mock.add_response(method="PUT", status_code=502)
+
+        async with YuqueClient(mock_config) as client:
+            with pytest.raises(YuqueAPIError) as exc_info:
+                await client.create_document_with_toc(
+                    "67890", DocumentCreate(title="Test", body="Body")
+                )
+
+        assert exc_info.value.status_code == 502
+        methods = [request.method for request in httpx_mock.get_requests()]
+        assert methods == ["POST", "PUT"]
+
+    @pytest.mark.asyncio
+    async def test_create_documents_with_toc(
+        self, mock_config: YuqueConfig, mock_document_response: dict, httpx_mock
+    ) -> None:
+        """Test bulk creation adds every created document in one TOC update."""
+        httpx_mock.add_response(
+            method="POST", json=mock_document_response, is_reusable=True
+        )
+        httpx_mock.add_response(method="PUT", json={"data": []})
+
+        async with YuqueClient(mock_config) as client:
+            results = await client.create_documents_with_toc(
+                "67890",
+                [DocumentCreate(title="A", body="a"), DocumentCreate(title="B", body="b")],
+            )
+
+        assert [doc.id for doc in results if isinstance(doc, Document)] == [11111, 11111]
+        methods = [request.method for request in httpx_mock.get_requests()]
+        assert methods == ["POST", "POST", "PUT"]
+
+    @pytest.mark.asyncio
+    async def test_create_documents_with_toc_loaders(
+        self, mock_config: YuqueConfig, mock_document_response: dict, httpx_mock
+    ) -> None:
+        """Test loaders run within the limit and their errors stay per item."""
+        httpx_mock.add_response(
+            method="POST", json=mock_document_response, is_reusable=True
+        )
+        httpx_mock.add_response(method="PUT", json={"data": []})
+        loading = 0
+        peak = 0
+
+        async def load() -> DocumentCreate:
+            nonlocal loading, peak
+            loading += 1
+            peak = max(peak, loading)
+            await asyncio.sleep(0)
+            loading -= 1
+            return DocumentCreate(title="A", body="a")
+
+        async def fail() -> DocumentCreate:
+            raise PermissionError("denied")
+
+        async with YuqueClient(mock_config) as client:
+            results = await client.create_documents_with_toc(
+                "67890", [load, fail, load], max_concurrent=2
+            )
+
+        assert isinstance(results[0], Document)
+        assert isinstance(results[1], PermissionError)
+        assert isinstance(results[2], Document)
+        assert peak <= 2
+        methods = [request.method for request in httpx_mock.get_requests()]
+        assert methods == ["POST", "POST", "PUT"]
+
+    @pytest.mark.asyncio
+    async def test_create_documents_with_toc_rolls_back_unexpected_error(
+        self, mock_config: YuqueConfig, mock_document_response: dict, httpx_mock
+    ) -> None:
+        """Test a create failing outside the API deletes the documents created."""
+        httpx_mock.add_response(method="POST", json=mock_document_response)
+        httpx_mock.add_response(method="POST", json={"data": {"id": "not-an-id"}})
+        httpx_mock.add_response(method="DELETE", json=mock_document_response)
+
+        async with YuqueClient(mock_config) as client:
+            with pytest.raises(ValidationError):
+                await client.create_documents_with_toc(
+                    "67890",
+                    [
+                        DocumentCreate(title="A", body="a"),
+                        DocumentCreate(title="B", body="b"),
+                    ],
+                    max_concurrent=1,
+                )
+
+        requests = httpx_mock.get_requests()
+        assert [request.method for request in requests] == ["POST", "POST", "DELETE"]
+        assert requests[2].url.path == "/api/v2/repos/67890/docs/11111"
+
+    @pytest.mark.asyncio
+    async def test_empty_response(self, mock_config: YuqueConfig, httpx_mock) -> None:
+        """Test 204 No Content responses parse to an empty dict."""
+        httpx_mock.add_response(status_code=204)
+
+        async with YuqueClient(mock_config) as client:
+            result = await client._request("DELETE", "/api/v2/repos/67890/docs/1")
+
+        assert result == {}
+
+
+class TestResponseCache:
+    """Test cases for the GET response cache in YuqueClient._request."""
+
+    @pytest.mark.asyncio
+    async def test_get_served_from_cache(
+        self, mock_config: YuqueConfig, mock_repository_response: dict, httpx_mock
+    ) -> None:
+        """Test repeated GETs hit the API only once."""
+        httpx_mock.add_response(method="GET", json=mock_repository_response)
+
+        async with YuqueClient(mock_config) as client:
+            first = await client.get_repository("67890")
+            second = await client.get_repository("67890")
+
+        assert first == second
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_without_etag_refetched(
+        self, mock_config: YuqueConfig, mock_repository_response: dict, httpx_mock
+    ) -> None:
+        """Test an expired response without an ETag is fetched again in full."""
+        httpx_mock.add_response(
+            method="GET", json=mock_repository_response, is_reusable=True
+        )
+
+        config = mock_config.model_copy(update={"cache_ttl": 0.0})
+        async with YuqueClient(config) as client:
+            await client.get_repository("67890")
+            await client.get_repository("67890")
+
+        requests = httpx_mock.get_requests()
+        assert len(requests) == 2
+        assert "If-None-Match" not in requests[1].headers
+
+    @pytest.mark.asyncio
+    async def test_replay_ignores_ttl_until_write(
+        self,
+        mock_config: YuqueConfig,
+        mock_repository_response: dict,
+        mock_document_response: dict,
+        httpx_mock,
+    ) -> None:
+        """Test the replay policy serves cached responses until a write."""
+        httpx_mock.add_response(
+            method="GET", json=mock_repository_response, is_reusable=True
+        )
+        httpx_mock.add_response(method="PUT", json=mock_document_response)
+
+        config = mock_config.model_copy(
+            update={"cache_policy": "replay", "cache_ttl": 0.0}
+        )
+        async with YuqueClient(config) as client:
+            await client.get_repository("67890")
+            await client.get_repository("67890")
+            await client.update_document(
+                "67890", "11111", DocumentUpdate(title="Renamed")
+            )
+            await client.get_repository("67890")
+
+        methods = [request.method for request in httpx_mock.get_requests()]
+        assert methods == ["GET", "PUT", "GET"]
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_cache(
+        self, mock_config: YuqueConfig, mock_document_response: dict, httpx_mock
+    ) -> None:
+        """Test a write drops every cached response."""
+        httpx_mock.add_response(json=mock_document_response, is_reusable=True)
+
+        async with YuqueClient(mock_config) as client:
+            await client.get_document("67890", "11111")
+            await client.update_document(
+                "67890", "11111", DocumentUpdate(title="Renamed")
+            )
+            await client.get_document("67890", "11111")
+
+        methods = [request.method for request in httpx_mock.get_requests()]
+        assert methods == ["GET", "PUT", "GET"]
+
+    @pytest.mark.asyncio
+    async def test_failed_write_invalidates_cache(
+        self, mock_config: YuqueConfig, mock_document_response: dict, httpx_mock
+    ) -> None:
+        """Test a write lost in transit still drops cached responses."""
+        httpx_mock.add_response(
+            method="GET", json=mock_document_response, is_reusable=True
+        )
+        httpx_mock.add_exception(httpx.ReadTimeout("timed out"), method="PUT")
+
+        async with YuqueClient(mock_config) as client:
+            await client.get_document("67890", "11111")
+            with pytest.raises(YuqueAPIError):
+                await client.update_document(
+                    "67890", "11111", DocumentUpdate(title="Renamed")
+                )
+            await client.get_document("67890", "11111")
+
+        methods = [request.method for request in httpx_mock.get_requests()]
+        assert methods == ["GET", "PUT", "GET"]
+
+    @pytest.mark.asyncio
+    async def test_write_by_id_invalidates_namespace_reads(
+        self,
+        mock_config: YuqueConfig,
+        mock_document_response: dict,
+        mock_toc_response: dict,
+        httpx_mock,
+    ) -> None:
+        """Test a write through the numeric ID drops reads cached by namespace."""
+        httpx_mock.add_response(method="GET", json=mock_toc_response, is_reusable=True)
+        httpx_mock.add_response(method="POST", json=mock_document_response)
+
+        async with YuqueClient(mock_config) as client:
+            await client.get_toc("user/book")
+            await client.create_document("12345", DocumentCreate(title="T", body="B"))
+            await client.get_toc("user/book")
+
+        requests = httpx_mock.get_requests()
+        assert [request.method for request in requests] == ["GET", "POST", "GET"]
+        assert requests[2].url.path == "/api/v2/repos/user/book/toc"
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(
+        self, mock_config: YuqueConfig, mock_user_response: dict, httpx_mock
+    ) -> None:
+        """Test the disabled cache policy always hits the API."""
+        httpx_mock.add_response(json=mock_user_response, is_reusable=True)
+        config = mock_config.model_copy(update={"cache_policy": "disabled"})
+
+        async with YuqueClient(config) as client:
+            await client.get_current_user()
+            await client.get_current_user()
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(
+        self, mock_config: YuqueConfig, mock_document_response: dict, httpx_mock
+    ) -> None:
+        """Test the cache keeps at most cache_max_entries responses."""
+        httpx_mock.add_response(json=mock_document_response, is_reusable=True)
+        config = mock_config.model_copy(update={"cache_max_entries": 2})
+
+        async with YuqueClient(config) as client:
+            await client.get_document("67890", "1")
+            await client.get_document("67890", "2")
+            await client.get_document("67890", "1")
+            await client.get_document("67890", "3")
+
+            assert list(client._cache) == [
+                "/api/v2/repos/67890/docs/1",
+                "/api/v2/repos/67890/docs/3",
+            ]
+
+        assert len(httpx_mock.get_requests()) == 3
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_revalidated_with_etag(
+        self, mock_config: YuqueConfig, mock_document_response: dict, httpx_mock
+    ) -> None:
+        """Test an expired response is revalidated and reused on 304."""
+        httpx_mock.add_response(
+            method="GET", json=mock_document_response, headers={"ETag": '"v1"'}
+        )
+        httpx_mock.add_response(method="GET", status_code=304)
+
+        config = mock_config.model_copy(update={"cache_ttl": 0.0})
+        async with YuqueClient(config) as client:
+            first = await client.get_document("67890", "11111")
+            second = await client.get_document("67890", "11111")
+
+        assert second.title == first.title
+        requests = httpx_mock.get_requests()
+        assert "If-None-Match" not in requests[0].headers
+        assert requests[1].headers["If-None-Match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_read_started_before_write_not_cached(
+        self, mock_config: YuqueConfig, mock_document_response: dict, httpx_mock
+    ) -> None:
+        """Test a GET answered after a concurrent write does not refill the cache."""
+        started = asyncio.Event()
+        release = asyncio.Event()
+        renamed = {"data": {**mock_document_response["data"], "title": "Renamed"}}
+
+        async def slow_read(request: httpx.Request) -> httpx.Response:
+            started.set()
+            await release.wait()
+            return httpx.Response(200, json=mock_document_response)
+
+        httpx_mock.add_callback(slow_read, method="GET")
+        httpx_mock.add_response(method="PUT", json=renamed)
+        httpx_mock.add_response(method="GET", json=renamed)
+
+        async with YuqueClient(mock_config) as client:
+            read = asyncio.ensure_future(client.get_document("67890", "11111"))
+            await started.wait()
+            await client.update_document(
+                "67890", "11111", DocumentUpdate(title="Renamed")
+            )
+            release.set()
+            await read
+            doc = await client.get_document("67890", "11111")
+
+        assert doc.title == "Renamed"
+        methods = [request.method for request in httpx_mock.get_requests()]
+        assert methods == ["GET", "PUT", "GET"]
+
+    @pytest.mark.asyncio
+    async def test_not_found_cached_until_write(
+        self, mock_config: YuqueConfig, mock_document_response: dict, httpx_mock
+    ) -> None:
+        """Test a 404 is remembered for repeated lookups and cleared by a write."""
+        httpx_mock.add_response(method="GET", status_code=404)
+        httpx_mock.add_response(method="POST", json=mock_document_response)
+        httpx_mock.add_response(method="GET", json=mock_document_response)
+
+        async with YuqueClient(mock_config) as client:
+            for _ in range(2):
+                with pytest.raises(YuqueAPIError) as exc_info:
+                    await client.get_document("67890", "11111")
+                assert exc_info.value.status_code == 404
+            await client.create_document("67890", DocumentCreate(title="T", body="B"))
+            doc = await client.get_document("67890", "11111")
+
+        assert doc.id == 11111
+        methods = [request.method for request in httpx_mock.get_requests()]
+        assert methods == ["GET", "POST", "GET"]
+
+    @pytest.mark.asyncio
+    async def test_list_documents_prefetch(
+        self, mock_config: YuqueConfig, mock_document_response: dict, httpx_mock
+    ) -> None:
+        """Test listed documents are read ahead into the cache when enabled."""
+        listed = [{**mock_document_response["data"], "id": doc_id} for doc_id in (1, 2, 3)]
+        httpx_mock.add_response(
+            url="https://www.yuque.com/api/v2/repos/67890/docs?limit=20&offset=0",
+            json={"data": listed},
+        )
+        httpx_mock.add_response(json=mock_document_response, is_reusable=True)
+        config = mock_config.model_copy(update={"prefetch_docs": 2})
+
+        async with YuqueClient(config) as client:
+            await client.list_documents("67890")
+            await asyncio.gather(*client._background)
+            await client.get_document("67890", 1)
+
+        paths = [request.url.path for request in httpx_mock.get_requests()]
+        assert paths == [
+            "/api/v2/repos/67890/docs",
+            "/api/v2/repos/67890/docs/1",
+            "/api/v2/repos/67890/docs/2",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_close_stops_pending_prefetch(
+        self, mock_config: YuqueConfig, mock_document_response: dict, httpx_mock
+    ) -> None:
+        """Test close cancels prefetch reads instead of leaving them running."""
+        listed = [{**mock_document_response["data"], "id": doc_id} for doc_id in (1, 2)]
+        httpx_mock.add_response(
+            url="https://www.yuque.com/api/v2/repos/67890/docs?limit=20&offset=0",
+            json={"data": listed},
+        )
+        reading = asyncio.Event()
+
+        async def never_answer(request: httpx.Request) -> httpx.Response:
+            reading.set()
+            await asyncio.Event().wait()
+            raise AssertionError("unreachable")
+
+        httpx_mock.add_callback(never_answer, is_reusable=True)
+        config = mock_config.model_copy(update={"prefetch_docs": 2})
+
+        client = YuqueClient(config)
+        await client.list_documents("67890")
+        await reading.wait()
+        await client.close()
+
+        assert not client._background
+        assert not client._requests
+        assert not client._inflight
+        assert client._client is None
+        assert not client._cache
+
+    @pytest.mark.asyncio
+    async def test_current_user_cached_until_close(
+        self, mock_config: YuqueConfig, mock_user_response: dict, httpx_mock
+    ) -> None:
+        """Test the current user outlives the response cache but not close()."""
+        httpx_mock.add_response(json=mock_user_response, is_reusable=True)
+
+        async with YuqueClient(mock_config) as client:
+            await client.get_current_user()
+            client._cache.clear()
+            await client.get_current_user()
+            assert len(httpx_mock.get_requests()) == 1
+
+            await client.close()
+            await client.get_current_user()
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_gets_coalesced(
+        self, mock_config: YuqueConfig, mock_document_response: dict, httpx_mock
+    ) -> None:
+        """Test concurrent identical GETs share one in-flight request."""
+        httpx_mock.add_response(json=mock_document_response, is_reusable=True)
+        config = mock_config.model_copy(update={"cache_policy": "disabled"})
+
+        async with YuqueClient(config) as client:
+            docs = await asyncio.gather(
+                *(client.get_document("67890", "11111") for _ in range(3))
+            )
+            assert client._inflight == {}
+
+        assert [doc.id for doc in docs] == [11111] * 3
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_request_cancelled_with_last_caller(
+        self, mock_config: YuqueConfig, httpx_mock
+    ) -> None:
+        """Test an in-flight GET stops once every caller has been cancelled."""
+        reading = asyncio.Event()
+
+        async def never_answer(request: httpx.Request) -> httpx.Response:
+            reading.set()
+            await asyncio.Event().wait()
+            raise AssertionError("unreachable")
+
+        httpx_mock.add_callback(never_answer)
+
+        async with YuqueClient(mock_config) as client:
+            read = asyncio.ensure_future(client.get_document("67890", "11111"))
+            await reading.wait()
+            (request,) = client._requests
+            read.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await read
+            with pytest.raises(asyncio.CancelledError):
+                await request
+            await asyncio.sleep(0)  # let the done callback run
+
+            assert not client._requests
+            assert not client._inflight
+            assert not client._waiters
+
 
 class TestModels:
     """Test cases for Pydantic models."""
@@ -186,6 +950,17 @@ class TestModels:
             # caching. In real tests, use proper environment isolation.
             pass
 
+    def test_get_config_cached(self) -> None:
+        """Test get_config reads the environment once."""
+        get_config.cache_clear()
+        try:
+            with patch.dict("os.environ", {"YUQUE_API_TOKEN": "env_token"}):
+                config = get_config()
+            assert config.api_token == "env_token"
+            assert get_config() is config
+        finally:
+            get_config.cache_clear()
+
     def test_user_model(self, mock_user_response: dict) -> None:
         """Test User model parsing."""
         user = User(**mock_user_response["data"])
@@ -200,6 +975,13 @@ class TestModels:
         assert repo.type == "Book"
         assert repo.items_count == 10
 
+    def test_visibility_level(self, mock_repository_response: dict) -> None:
+        """Test visibility accepts the three Yuque levels only."""
+        data = mock_repository_response["data"]
+        assert Repository(**{**data, "public": "2"}).public == 2
+        with pytest.raises(ValidationError):
+            Repository(**{**data, "public": 3})
+
     def test_document_model(self, mock_document_response: dict) -> None:
         """Test Document model parsing."""
         doc = Document(**mock_document_response["data"])
@@ -207,6 +989,52 @@ class TestModels:
         assert doc.format == "markdown"
         assert "Test" in doc.body
 
+    def test_from_api_trusted(self, mock_document_response: dict) -> None:
+        """Test from_api skips validation only for trusted data."""
+        data = {**mock_document_response["data"], "updated_at": "2024-01-01T00:00:00Z"}
+
+        validated = Document.from_api(data)
+        trusted = Document.from_api(data, trusted=True)
+
+        assert validated.updated_at == "2024-01-01T00:00:00Z"
+        assert trusted.updated_at == "2024-01-01T00:00:00Z"
+        assert trusted.title == validated.title
+
+    def test_timestamps_parsed_lazily(self, mock_document_response: dict) -> None:
+        """Test timestamps stay strings and parse on demand."""
+        data = {
+            **mock_document_response["data"],
+            "created_at": "2024-01-01T08:30:00.000Z",
+        }
+        doc = Document(**data)
+
+        assert doc.created_at == "2024-01-01T08:30:00.000Z"
+        assert doc.created_at_dt is not None
+        assert doc.created_at_dt.year == 2024
+        assert doc.created_at_dt.utcoffset() == timedelta(0)
+        assert doc.updated_at_dt is None
+
+    def test_toc_node_empty_ids(self) -> None:
+        """Test TocNode treats empty string ids from the API as missing."""
+        node = TocNode(uuid="uuid-1", type="TITLE", title="Intro", doc_id="", id="42")
+        assert node.doc_id is None
+        assert node.id == 42
+
+    def test_toc_node_types_interned(self, mock_toc_response: dict) -> None:
+        """Test repeated node types share one string object."""
+        items = [
+            {**mock_toc_response["data"][1], "type": "".join(["D", "O", "C"])}
+            for _ in range(2)
+        ]
+        first, second = (TocNode.model_validate(item) for item in items)
+        assert first.type is second.type
+
+    def test_toc_update_request_accepts_enums(self) -> None:
+        """Test TocUpdateRequest accepts enum members and stores plain strings."""
+        request = TocUpdateRequest(action=TocAction.APPEND_NODE, action_mode="child")
+        assert request.action == "appendNode"
+        assert type(request.action) is str
+
     def test_yuque_api_error(self) -> None:
         """Test YuqueAPIError exception."""
         error = YuqueAPIError(404, "Entity not found", {"id": 123})
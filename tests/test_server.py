@@ -0,0 +1,201 @@
+"""Tests for the Yuque MCP server tools."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from yuque_mcp import server
+from yuque_mcp.client import YuqueClient
+from yuque_mcp.models import YuqueConfig
+
+
+class TestReadMarkdownFile:
+    """Test cases for title extraction in _read_markdown_file."""
+
+    @pytest.mark.parametrize(
+        ("content", "title"),
+        [
+            ("# Title\n\nBody", "Title"),
+            ("\n  \n  #   Spaced  \nBody", "Spaced"),
+            ("# \u3000标题\u3000\n正文", "标题"),
+            ("# Windows\r\nBody", "Windows"),
+            ("\r# Mac\rBody", "Mac"),
+            ("## Subheading\n# Title", None),
+            ("#NoSpace\n", None),
+            ("# \nBody", None),
+            ("Body first\n# Title", None),
+            ("", None),
+        ],
+    )
+    def test_title_from_first_heading(
+        self, content: str, title: str | None, tmp_path: Path
+    ) -> None:
+        """Test the title is a '# heading' on the first non-blank line."""
+        path = tmp_path / "doc.md"
+        path.write_bytes(content.encode("utf-8"))
+
+        assert server._read_markdown_file(str(path))[1] == title
+
+
+class TestFileTools:
+    """Test cases for the file-based upload tools."""
+
+    @pytest.mark.asyncio
+    async def test_create_documents_from_files_reports_each_file(
+        self,
+        mock_config: YuqueConfig,
+        mock_document_response: dict,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        httpx_mock,
+    ) -> None:
+        """Test unreadable files are reported per file while the others import."""
+        readable = tmp_path / "readable.md"
+        readable.write_text("# Readable\n\nBody", encoding="utf-8")
+        locked = tmp_path / "locked.md"
+        locked.write_text("# Locked", encoding="utf-8")
+        read_markdown_file = server._read_markdown_file
+
+        def read_or_deny(file_path: str) -> tuple[str, str | None]:
+            if file_path == str(locked):
+                raise PermissionError(f"Permission denied: {file_path}")
+            return read_markdown_file(file_path)
+
+        monkeypatch.setattr(server, "_read_markdown_file", read_or_deny)
+        httpx_mock.add_response(method="POST", json=mock_document_response)
+        httpx_mock.add_response(method="PUT", json={"data": []})
+
+        async with YuqueClient(mock_config) as client:
+            monkeypatch.setattr(server, "get_client", lambda: client)
+            output = await server.yuque_create_documents_from_files(
+                "67890", [str(readable), str(locked), str(tmp_path / "missing.md")]
+            )
+
+        lines = output.splitlines()
+        assert lines[0] == "Created 1 of 3 documents and added them to TOC"
+        assert lines[2] == f"✓ {readable}: ID 11111 | Title: Test Document"
+        assert lines[3].startswith(f"✗ {locked}: File error: Permission denied")
+        assert lines[4].startswith(f"✗ {tmp_path / 'missing.md'}: File error:")
+
+    @pytest.mark.asyncio
+    async def test_create_documents_from_files_clamps_concurrency(
+        self, mock_config: YuqueConfig, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the caller's max_concurrent is clamped before reaching the client."""
+        client = YuqueClient(mock_config)
+        create = AsyncMock(return_value=[])
+        monkeypatch.setattr(client, "create_documents_with_toc", create)
+        monkeypatch.setattr(server, "get_client", lambda: client)
+
+        await server.yuque_create_documents_from_files("67890", [], max_concurrent=500)
+
+        assert create.call_args.args[3] == server.MAX_IMPORT_CONCURRENCY
+
+    @pytest.mark.asyncio
+    async def test_create_documents_from_directory_capped(self, tmp_path: Path) -> None:
+        """Test imports larger than one TOC update are refused before any read."""
+        for index in range(server.MAX_TOC_DOC_IDS + 1):
+            (tmp_path / f"{index}.md").touch()
+
+        output = await server.yuque_create_documents_from_directory(
+            "67890", str(tmp_path)
+        )
+
+        assert output == (
+            f"✗ Error: {server.MAX_TOC_DOC_IDS + 1} files given; at most "
+            f"{server.MAX_TOC_DOC_IDS} can be imported at once."
+        )
+
+
+class TestInputValidation:
+    """Test cases for tool inputs rejected before any request is made."""
+
+    @pytest.mark.asyncio
+    async def test_invalid_visibility_level(self) -> None:
+        """Test out-of-range public values return a tool error, not a raise."""
+        outputs = [
+            await server.yuque_create_repository("user", "Repo", "repo", public=5),
+            await server.yuque_create_document_with_toc("1", "T", "B", public=5),
+            await server.yuque_update_document("1", "2", public=-1),
+            await server.yuque_create_document_from_file("1", "x.md", public=3),
+            await server.yuque_update_document_from_file("1", "2", "x.md", public=3),
+        ]
+
+        for output in outputs:
+            assert output.startswith("✗ Error: Unknown visibility level")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("query", "prefetch", "error"),
+        [
+            ("  ", 1, "✗ Error: Search query is empty."),
+            ("q" * 201, 1, "✗ Error: Search query exceeds 200 characters."),
+            ("query", 0, "✗ Error: prefetch must be between 1 and 5."),
+            ("query", 6, "✗ Error: prefetch must be between 1 and 5."),
+        ],
+    )
+    async def test_invalid_search_input(
+        self, query: str, prefetch: int, error: str
+    ) -> None:
+        """Test empty or overlong queries and out-of-range prefetch are refused."""
+        output = await server.yuque_search_and_read(query, "1", prefetch=prefetch)
+
+        assert output == error
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("action", "action_mode", "error"),
+        [
+            ("moveNode", "child", "✗ Error: Unknown action 'moveNode'."),
+            ("appendNode", "parent", "✗ Error: Unknown action_mode 'parent'."),
+        ],
+    )
+    async def test_invalid_toc_action(
+        self, action: str, action_mode: str, error: str
+    ) -> None:
+        """Test unknown TOC actions and modes are refused."""
+        assert await server.yuque_update_toc("1", action, action_mode) == error
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("doc_ids", "error"),
+        [
+            ("1, x", "✗ Error: doc_ids must be comma-separated integers"),
+            (
+                ",".join(["1"] * (server.MAX_TOC_DOC_IDS + 1)),
+                f"✗ Error: at most {server.MAX_TOC_DOC_IDS} doc_ids per TOC update",
+            ),
+        ],
+    )
+    async def test_invalid_toc_doc_ids(
+        self,
+        doc_ids: str,
+        error: str,
+        mock_config: YuqueConfig,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test malformed or oversized doc_ids are refused before the update."""
+        client = YuqueClient(mock_config)
+        update_toc = AsyncMock()
+        monkeypatch.setattr(client, "update_toc", update_toc)
+        monkeypatch.setattr(server, "get_client", lambda: client)
+
+        output = await server.yuque_update_toc(
+            "1", "appendNode", "child", doc_ids=doc_ids
+        )
+
+        assert output.startswith(error)
+        update_toc.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_noop_updates(self) -> None:
+        """Test updates that would change nothing are refused."""
+        assert (
+            await server.yuque_update_document("1", "2")
+            == "✗ Error: No fields provided to update."
+        )
+        assert (
+            await server.yuque_update_toc("1", "editNode", "child", node_uuid="abc")
+            == "✗ Error: No fields provided to edit."
+        )